@@ -0,0 +1,254 @@
+"""Shared response cache for MCP tools.
+
+Tool results are stored in SQLite with a per-endpoint TTL policy, fronted by
+a small in-memory LFU cache. Entries past their soft TTL are still served
+while a background task refreshes them (stale-while-revalidate). When the
+upstream API fails, the last cached result is returned with "stale": True
+even if it has expired. Concurrent identical calls are coalesced so only
+one reaches the upstream API.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Coroutine
+
+import httpx
+
+from .db import CacheRepository, get_session
+from .serper.client import SerperError
+
+# TTL policies (hours)
+POLICIES = {
+    "short": 12,  # Reddit
+    "normal": 24,  # YouTube
+    "long": 48,  # Serper
+}
+
+# Fraction of the TTL after which a hit also triggers a background refresh
+_SOFT_TTL_RATIO = 0.75
+
+# Cache keys are tuples, e.g. ("serper", "serp", query, num, gl). They are
+# hashed as-is in memory and joined with ":" only for the SQLite key.
+CacheKey = tuple
+
+# In-memory front: key -> [hits, monotonic expiry, data]. Entries are capped
+# at _MEM_TTL so the SQLite row stays authoritative; expired entries are kept
+# as a stale fallback until evicted.
+_MEM_CACHE: dict[CacheKey, list] = {}
+_MEM_CACHE_MAXSIZE = 4096
+_MEM_TTL = 15 * 60  # seconds
+_mem_lock = threading.Lock()
+
+# Single-flight table: key -> the in-progress upstream call for it
+_inflight: dict[CacheKey, asyncio.Task] = {}
+
+# Background refreshes, referenced until they finish
+_background: set[asyncio.Task] = set()
+
+# Upstream failures that fall back to a stale entry
+_UPSTREAM_ERRORS = (SerperError, httpx.HTTPError)
+
+ToolFn = Callable[..., Awaitable[dict]]
+
+
+def canonical(text: str) -> str:
+    """Normalize free text for use in a cache key."""
+    return " ".join(text.lower().split())
+
+
+def _db_key(key: CacheKey) -> str:
+    """SQLite key for a cache key tuple (shared with the CLI's string keys)."""
+    return ":".join(map(str, key))
+
+
+def _mem_get(key: CacheKey, allow_stale: bool = False) -> Any | None:
+    """Get data from the in-memory cache if present (and fresh)."""
+    with _mem_lock:
+        entry = _MEM_CACHE.get(key)
+        if entry is None:
+            return None
+        entry[0] += 1
+        if not allow_stale and entry[1] <= time.monotonic():
+            return None
+        return entry[2]
+
+
+def _mem_put(key: CacheKey, data: Any, ttl_seconds: float) -> None:
+    """Store data in the in-memory cache, evicting the least frequently used."""
+    with _mem_lock:
+        entry = _MEM_CACHE.get(key)
+        if entry is not None:
+            entry[1:] = [time.monotonic() + ttl_seconds, data]
+            return
+        if len(_MEM_CACHE) >= _MEM_CACHE_MAXSIZE:
+            del _MEM_CACHE[min(_MEM_CACHE, key=lambda k: _MEM_CACHE[k][0])]
+        _MEM_CACHE[key] = [1, time.monotonic() + ttl_seconds, data]
+
+
+def _db_peek(key: str) -> tuple[Any, datetime, datetime] | None:
+    """Get cached data and its created/expiry times from SQLite."""
+    with get_session() as session:
+        repo = CacheRepository(session)
+        return repo.peek(key)
+
+
+def _db_set(key: str, data: Any, ttl_hours: int) -> None:
+    """Write cached data to SQLite."""
+    with get_session() as session:
+        repo = CacheRepository(session)
+        repo.set(key, data, ttl_hours=ttl_hours)
+
+
+async def _lookup(key: CacheKey) -> tuple[Any, bool] | None:
+    """Get unexpired cached data and whether it is past its soft TTL.
+
+    Memory is checked first, then SQLite off the loop.
+    """
+    data = _mem_get(key)
+    if data is not None:
+        return data, False
+
+    hit = await asyncio.to_thread(_db_peek, _db_key(key))
+    if hit is None:
+        return None
+    data, created_at, expires_at = hit
+    now = datetime.utcnow()
+    if expires_at <= now:
+        return None
+
+    _mem_put(key, data, min(_MEM_TTL, (expires_at - now).total_seconds()))
+    soft_expires_at = created_at + (expires_at - created_at) * _SOFT_TTL_RATIO
+    return data, soft_expires_at <= now
+
+
+async def _lookup_stale(key: CacheKey) -> Any | None:
+    """Get the last cached data for a key, even if expired."""
+    hit = await asyncio.to_thread(_db_peek, _db_key(key))
+    if hit is not None:
+        return hit[0]
+    return _mem_get(key, allow_stale=True)
+
+
+async def _store(key: CacheKey, data: Any, ttl_hours: int) -> None:
+    """Cache data with TTL (SQLite write runs in a worker thread)."""
+    await asyncio.to_thread(_db_set, _db_key(key), data, ttl_hours)
+    _mem_put(key, data, min(ttl_hours * 3600, _MEM_TTL))
+
+
+async def _single_flight(key: CacheKey, call: Callable[[], Awaitable[dict]]) -> dict:
+    """Run call() once per key at a time; concurrent callers share its result."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(call())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller being cancelled does not cancel the others
+    return await asyncio.shield(task)
+
+
+def _spawn(coro: Coroutine[Any, Any, Any]) -> None:
+    """Run a refresh in the background without awaiting it."""
+    task = asyncio.ensure_future(coro)
+    _background.add(task)
+    task.add_done_callback(_background_done)
+
+
+def _background_done(task: asyncio.Task) -> None:
+    _background.discard(task)
+    if not task.cancelled():
+        task.exception()  # a failed refresh is retried by the next call
+
+
+def _bind(signature: inspect.Signature, args: tuple, kwargs: dict) -> dict[str, Any]:
+    """Map call arguments (including defaults) to parameter names."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
+def coalesce(key_fn: Callable[..., CacheKey | None]) -> Callable[[ToolFn], ToolFn]:
+    """Share one in-flight call among concurrent identical calls of an async tool.
+
+    Args:
+        key_fn: Called with the tool's arguments; returns the coalescing key,
+            or None to run the call on its own
+    """
+
+    def decorator(fn: ToolFn) -> ToolFn:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict:
+            key = key_fn(**_bind(signature, args, kwargs))
+            if key is None:
+                return await fn(*args, **kwargs)
+            return await _single_flight(key, lambda: fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def cached(
+    policy: str,
+    key_fn: Callable[..., CacheKey | None],
+    hit_overlay: Callable[..., dict] | None = None,
+) -> Callable[[ToolFn], ToolFn]:
+    """Cache the dict result of an async tool.
+
+    Args:
+        policy: TTL policy name (short, normal, long)
+        key_fn: Called with the tool's arguments; returns the cache key, or
+            None to bypass the cache
+        hit_overlay: Called with the tool's arguments; returns fields set on
+            cached results, e.g. to echo this call's query when the key is
+            normalized or the row was written by the CLI
+
+    A `no_cache` argument on the tool skips the lookup (the fresh result is
+    still stored). Results containing "error" are not cached. Cache misses
+    are coalesced as in coalesce(). Hits past the soft TTL are returned
+    immediately and refreshed in the background.
+    """
+    ttl_hours = POLICIES[policy]
+
+    def decorator(fn: ToolFn) -> ToolFn:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict:
+            arguments = _bind(signature, args, kwargs)
+            key = key_fn(**arguments)
+            if key is None:
+                return await fn(*args, **kwargs)
+            overlay = hit_overlay(**arguments) if hit_overlay else {}
+
+            async def fetch() -> dict:
+                try:
+                    result = await fn(*args, **kwargs)
+                except _UPSTREAM_ERRORS:
+                    stale = await _lookup_stale(key)
+                    if stale is None:
+                        raise
+                    return {**stale, **overlay, "cached": True, "stale": True}
+
+                if "error" not in result:
+                    await _store(key, result, ttl_hours)
+                return result
+
+            if not arguments.get("no_cache"):
+                hit = await _lookup(key)
+                if hit is not None:
+                    data, revalidate = hit
+                    if revalidate:
+                        _spawn(_single_flight(key, fetch))
+                    return {**data, **overlay, "cached": True}
+
+            return await _single_flight(key, fetch)
+
+        return wrapper
+
+    return decorator
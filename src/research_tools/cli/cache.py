@@ -6,7 +6,7 @@ from cyclopts import App, Parameter
 from rich.console import Console
 from rich.prompt import Confirm
 
-from ..db import CacheRepository, get_session, init_db
+from ..db import CacheRepository, get_session
 
 app = App(
     name="cache",
@@ -19,7 +19,6 @@ console = Console()
 @app.command
 def stats() -> None:
     """Show cache statistics."""
-    init_db()
     with get_session() as session:
         repo = CacheRepository(session)
         cache_stats = repo.stats()
@@ -38,7 +37,6 @@ def clear(
     ] = False,
 ) -> None:
     """Clear all cache entries."""
-    init_db()
     with get_session() as session:
         repo = CacheRepository(session)
         cache_stats = repo.stats()
@@ -63,7 +61,6 @@ def clear(
 @app.command
 def cleanup() -> None:
     """Remove expired cache entries."""
-    init_db()
     with get_session() as session:
         repo = CacheRepository(session)
         deleted = repo.cleanup()
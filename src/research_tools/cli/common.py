@@ -1,13 +1,48 @@
 """Shared CLI utilities."""
 
-import json
+import asyncio
+import os
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Coroutine, TypeVar
+
+from .. import fastjson
+from ..eventloop import new_event_loop
+from ..serper.client import aclose_shared_client
+
+T = TypeVar("T")
+
+# Event loop kept between commands when RT_PERSIST_LOOP=1
+_persistent_loop: asyncio.AbstractEventLoop | None = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a command coroutine to completion.
+
+    With RT_PERSIST_LOOP=1 the event loop is created once and reused by every
+    command in the process (REPL or script wrappers), instead of paying loop
+    setup/teardown per command.
+    """
+    global _persistent_loop
+    if os.getenv("RT_PERSIST_LOOP") == "1":
+        if _persistent_loop is None or _persistent_loop.is_closed():
+            _persistent_loop = new_event_loop()
+        return _persistent_loop.run_until_complete(coro)
+
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        return runner.run(_closing_http(coro))
+
+
+async def _closing_http(coro: Coroutine[Any, Any, T]) -> T:
+    """Await coro, then close the shared HTTP pool before its loop ends."""
+    try:
+        return await coro
+    finally:
+        await aclose_shared_client()
 
 
 def output_json(data: dict[str, Any], output_path: Path | None) -> None:
     """Output JSON to stdout or file."""
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
+    json_str = fastjson.dumps_pretty(data)
     if output_path:
         output_path.write_text(json_str, encoding="utf-8")
         print(f"Output written to: {output_path}")
@@ -35,3 +70,14 @@ def output_result(
         output_json(data, output_path)
     else:
         render_fn(*render_args)
+
+
+async def output_result_async(
+    data: dict[str, Any],
+    json_output: bool,
+    output_path: Path | None,
+    render_fn: Callable[..., None],
+    *render_args: Any,
+) -> None:
+    """Run output_result in a worker thread so it can overlap other I/O."""
+    await asyncio.to_thread(output_result, data, json_output, output_path, render_fn, *render_args)
@@ -1,20 +1,24 @@
 """Dev.to research CLI commands."""
 
-import asyncio
+import functools
+import re
 import sys
-from collections import defaultdict
 from pathlib import Path
 from typing import Annotated
 
 from cyclopts import App, Parameter
 
-from .common import output_result
-from ..sources import Article, TagStats, AuthorStats, DevToResearch
+from .common import output_result, run_async
+from ..serialize import serialize_articles
+from ..sources import DevToResearch, aggregate_tags, aggregate_authors
 from ..output import render_trending, render_tags, render_authors
 
 app = App(help="Dev.to research commands")
 
 
+# Comma/whitespace separated tokens
+_TOKEN_RE = re.compile(r"[^,\s]+")
+
 # Reusable parameter types
 TagsOpt = Annotated[str | None, Parameter(name=["-t", "--tags"], help="Comma-separated tags")]
 PeriodOpt = Annotated[int, Parameter(name="--period", help="Time period in days")]
@@ -27,9 +31,10 @@ def _parse_tags(tags: str | None) -> list[str] | None:
     """Parse comma-separated tags string."""
     if not tags:
         return None
-    return [t.strip() for t in tags.split(",") if t.strip()]
+    return _TOKEN_RE.findall(tags)
 
 
+@functools.cache
 def _get_devto_source() -> DevToResearch:
     """Get dev.to research source."""
     from ..config import load_env_config
@@ -50,7 +55,8 @@ def trending(
     src = _get_devto_source()
 
     async def _run() -> None:
-        articles = await src.fetch_articles(tags=tag_list, period=period, limit=limit)
+        async with src:
+            articles = await src.fetch_articles(tags=tag_list, period=period, limit=limit)
 
         data = {
             "command": "trending",
@@ -58,24 +64,11 @@ def trending(
             "period": period,
             "tags": tag_list,
             "count": len(articles),
-            "articles": [
-                {
-                    "id": a.id,
-                    "title": a.title,
-                    "url": a.url,
-                    "author": a.author,
-                    "reactions": a.reactions,
-                    "comments": a.comments,
-                    "reading_time": a.reading_time,
-                    "tags": a.tags,
-                    "published_at": a.published_at.isoformat(),
-                }
-                for a in articles
-            ],
+            "articles": serialize_articles(articles),
         }
         output_result(data, json_output, output, render_trending, articles, period, tag_list)
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @app.command
@@ -96,39 +89,15 @@ def tags(
     sample_size = max(100, limit * 10)
 
     async def _run() -> None:
-        articles = await src.fetch_articles(tags=tag_list, period=period, limit=sample_size)
-
-        # Aggregate by tag
-        tag_data: dict[str, list[Article]] = defaultdict(list)
-        for article in articles:
-            for tag in article.tags:
-                if tag in tag_list:
-                    tag_data[tag].append(article)
-
-        # Calculate stats
-        tag_stats: list[TagStats] = []
-        for tag_name in tag_list:
-            tag_articles = tag_data.get(tag_name, [])
-            if not tag_articles:
-                continue
-
-            count = len(tag_articles)
-            total_reactions = sum(a.reactions for a in tag_articles)
-            total_comments = sum(a.comments for a in tag_articles)
-            total_reading = sum(a.reading_time for a in tag_articles)
-
-            tag_stats.append(TagStats(
-                name=tag_name,
-                article_count=count,
-                total_reactions=total_reactions,
-                total_comments=total_comments,
-                avg_reactions=total_reactions / count,
-                avg_comments=total_comments / count,
-                avg_reading_time=total_reading / count,
-            ))
-
-        tag_stats.sort(key=lambda t: t.avg_reactions, reverse=True)
-        tag_stats = tag_stats[:limit]
+        # Full sample, round-robin across tags so each tag is represented
+        async with src:
+            articles = [
+                article
+                async for page in src.iter_articles(tags=tag_list, period=period, limit=sample_size)
+                for article in page
+            ]
+
+        tag_stats = aggregate_tags(articles, tag_list, limit)
 
         data = {
             "command": "tags",
@@ -150,7 +119,7 @@ def tags(
         }
         output_result(data, json_output, output, render_tags, tag_stats, len(articles), period)
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @app.command
@@ -167,31 +136,15 @@ def authors(
     sample_size = max(100, limit * 10)
 
     async def _run() -> None:
-        articles = await src.fetch_articles(tags=tag_list, period=period, limit=sample_size)
-
-        # Aggregate by author
-        author_data: dict[str, list[Article]] = defaultdict(list)
-        for article in articles:
-            author_data[article.author].append(article)
-
-        # Calculate stats
-        author_stats: list[AuthorStats] = []
-        for username, user_articles in author_data.items():
-            count = len(user_articles)
-            total_reactions = sum(a.reactions for a in user_articles)
-            total_comments = sum(a.comments for a in user_articles)
-
-            author_stats.append(AuthorStats(
-                username=username,
-                article_count=count,
-                total_reactions=total_reactions,
-                total_comments=total_comments,
-                avg_reactions=total_reactions / count,
-                articles=user_articles,
-            ))
-
-        author_stats.sort(key=lambda a: a.total_reactions, reverse=True)
-        author_stats = author_stats[:limit]
+        # Full sample, round-robin across tags so each tag is represented
+        async with src:
+            articles = [
+                article
+                async for page in src.iter_articles(tags=tag_list, period=period, limit=sample_size)
+                for article in page
+            ]
+
+        author_stats = aggregate_authors(articles, limit)
 
         data = {
             "command": "authors",
@@ -212,4 +165,4 @@ def authors(
         }
         output_result(data, json_output, output, render_authors, author_stats, len(articles), period, tag_list)
 
-    asyncio.run(_run())
+    run_async(_run())
@@ -1,15 +1,17 @@
 """Google/Serper research CLI commands."""
 
 import asyncio
+import functools
 import sys
 from pathlib import Path
 from typing import Annotated, Any
 
 from cyclopts import App, Parameter
 
-from .common import output_result
-from ..db import CacheRepository, get_session, init_db
-from ..sources import SerperResearch
+from .common import output_result, output_result_async, run_async
+from ..serialize import serialize_organic, serialize_paa
+from ..db import CacheRepository, get_session
+from ..sources import SerperResearch, SerpAnalysis
 from ..output import render_keywords, render_serp, render_paa, render_related
 
 app = App(help="Google/Serper research commands")
@@ -28,20 +30,64 @@ CACHE_TTL = 48
 
 def _get_cached(cache_key: str) -> Any | None:
     """Get cached data if exists."""
-    init_db()
     with get_session() as session:
         repo = CacheRepository(session)
         return repo.get(cache_key)
 
 
+def _get_cached_many(cache_keys: list[str]) -> dict[str, Any]:
+    """Get cached data for several keys with a single query."""
+    with get_session() as session:
+        repo = CacheRepository(session)
+        return repo.get_many(cache_keys)
+
+
 def _set_cache(cache_key: str, data: Any) -> None:
     """Cache data with TTL."""
-    init_db()
     with get_session() as session:
         repo = CacheRepository(session)
         repo.set(cache_key, data, ttl_hours=CACHE_TTL)
 
 
+async def _set_cache_async(cache_key: str, data: Any) -> None:
+    """Cache data with TTL without blocking the event loop."""
+    await asyncio.to_thread(_set_cache, cache_key, data)
+
+
+def _set_cache_many(items: dict[str, Any]) -> None:
+    """Cache several entries with TTL in a single transaction."""
+    with get_session() as session:
+        repo = CacheRepository(session)
+        repo.set_many(items, ttl_hours=CACHE_TTL)
+
+
+async def _set_cache_many_async(items: dict[str, Any]) -> None:
+    """Cache several entries without blocking the event loop."""
+    await asyncio.to_thread(_set_cache_many, items)
+
+
+def _serp_payload(data: SerpAnalysis) -> dict[str, Any]:
+    """Build the cached JSON shape of a SERP analysis."""
+    return {
+        "query": data.query,
+        "results": serialize_organic(data.results),
+        "people_also_ask": serialize_paa(data.people_also_ask),
+        "related_searches": data.related_searches,
+    }
+
+
+def _serp_from_cache(cached: dict[str, Any]) -> SerpAnalysis:
+    """Rebuild SerpAnalysis from its cached JSON shape."""
+    from ..serper.client import OrganicResult, PeopleAlsoAsk
+    return SerpAnalysis(
+        query=cached["query"],
+        results=[OrganicResult(**r) for r in cached["results"]],
+        people_also_ask=[PeopleAlsoAsk(**p) for p in cached.get("people_also_ask", [])],
+        related_searches=cached.get("related_searches", []),
+    )
+
+
+@functools.cache
 def _get_serper_source() -> SerperResearch:
     """Get Serper research source."""
     from ..config import load_env_config
@@ -68,31 +114,32 @@ def keywords(
         cached = _get_cached(cache_key)
         if cached:
             from ..sources import KeywordSuggestions
-            data = KeywordSuggestions(**cached)
             output_result(
-                {"command": "keywords", "query": data.query, "suggestions": data.suggestions, "cached": True},
+                {"command": "keywords", "query": cached["query"], "suggestions": cached["suggestions"], "cached": True},
                 json_output,
                 output,
-                render_keywords,
-                data,
+                lambda: render_keywords(KeywordSuggestions(**cached)),
             )
             return
 
     src = _get_serper_source()
 
     async def _run() -> None:
-        data = await src.get_keywords(query)
-        # Cache result
-        _set_cache(cache_key, {"query": data.query, "suggestions": data.suggestions})
-        output_result(
-            {"command": "keywords", "query": data.query, "suggestions": data.suggestions},
-            json_output,
-            output,
-            render_keywords,
-            data,
+        async with src:
+            data = await src.get_keywords(query)
+        # Cache write overlaps with rendering
+        await asyncio.gather(
+            _set_cache_async(cache_key, {"query": data.query, "suggestions": data.suggestions}),
+            output_result_async(
+                {"command": "keywords", "query": data.query, "suggestions": data.suggestions},
+                json_output,
+                output,
+                render_keywords,
+                data,
+            ),
         )
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @app.command
@@ -111,64 +158,34 @@ def serp(
     if not no_cache:
         cached = _get_cached(cache_key)
         if cached:
-            from ..sources import SerpAnalysis
-            from ..serper.client import OrganicResult, PeopleAlsoAsk
-            data = SerpAnalysis(
-                query=cached["query"],
-                results=[OrganicResult(**r) for r in cached["results"]],
-                people_also_ask=[PeopleAlsoAsk(**p) for p in cached.get("people_also_ask", [])],
-                related_searches=cached.get("related_searches", []),
-            )
+            # Cache stores the JSON shape; only rebuild dataclasses for Rich
             output_result(
-                {
-                    "command": "serp",
-                    "query": data.query,
-                    "results": [
-                        {"position": r.position, "title": r.title, "link": r.link, "snippet": r.snippet}
-                        for r in data.results
-                    ],
-                    "cached": True,
-                },
+                {"command": "serp", "query": cached["query"], "results": cached["results"], "cached": True},
                 json_output,
                 output,
-                render_serp,
-                data,
+                lambda: render_serp(_serp_from_cache(cached)),
             )
             return
 
     src = _get_serper_source()
 
     async def _run() -> None:
-        data = await src.get_serp(query, num=num, gl=gl)
-        # Cache result
-        _set_cache(cache_key, {
-            "query": data.query,
-            "results": [
-                {"position": r.position, "title": r.title, "link": r.link, "snippet": r.snippet}
-                for r in data.results
-            ],
-            "people_also_ask": [
-                {"question": p.question, "snippet": p.snippet, "link": p.link}
-                for p in data.people_also_ask
-            ],
-            "related_searches": data.related_searches,
-        })
-        output_result(
-            {
-                "command": "serp",
-                "query": data.query,
-                "results": [
-                    {"position": r.position, "title": r.title, "link": r.link, "snippet": r.snippet}
-                    for r in data.results
-                ],
-            },
-            json_output,
-            output,
-            render_serp,
-            data,
+        async with src:
+            data = await src.get_serp(query, num=num, gl=gl)
+        payload = _serp_payload(data)
+        # Cache write overlaps with rendering
+        await asyncio.gather(
+            _set_cache_async(cache_key, payload),
+            output_result_async(
+                {"command": "serp", "query": data.query, "results": payload["results"]},
+                json_output,
+                output,
+                render_serp,
+                data,
+            ),
         )
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @app.command
@@ -181,50 +198,50 @@ def paa(
 ) -> None:
     """Get People Also Ask questions."""
     cache_key = f"serper:paa:{query}:{gl}"
+    # PAA comes from the same search call as a default SERP lookup
+    serp_key = f"serper:serp:{query}:10:{gl}"
 
     # Check cache
     if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
+        hits = _get_cached_many([cache_key, serp_key])
+        questions = None
+        if hits.get(cache_key):
+            questions = hits[cache_key]["questions"]
+        elif hits.get(serp_key):
+            questions = hits[serp_key].get("people_also_ask", [])
+        if questions is not None:
             from ..serper.client import PeopleAlsoAsk
-            items = [PeopleAlsoAsk(**p) for p in cached["questions"]]
             output_result(
-                {
-                    "command": "paa",
-                    "query": query,
-                    "questions": [{"question": i.question, "snippet": i.snippet, "link": i.link} for i in items],
-                    "cached": True,
-                },
+                {"command": "paa", "query": query, "questions": questions, "cached": True},
                 json_output,
                 output,
-                render_paa,
-                query,
-                items,
+                lambda: render_paa(query, [PeopleAlsoAsk(**p) for p in questions]),
             )
             return
 
     src = _get_serper_source()
 
     async def _run() -> None:
-        items = await src.get_paa(query, gl=gl)
-        # Cache result
-        _set_cache(cache_key, {
-            "questions": [{"question": i.question, "snippet": i.snippet, "link": i.link} for i in items],
-        })
-        output_result(
-            {
-                "command": "paa",
-                "query": query,
-                "questions": [{"question": i.question, "snippet": i.snippet, "link": i.link} for i in items],
-            },
-            json_output,
-            output,
-            render_paa,
-            query,
-            items,
+        async with src:
+            # Same search call as get_paa(); keep the full SERP for the cache
+            data = await src.get_serp(query, num=10, gl=gl)
+        items = data.people_also_ask
+        payload = _serp_payload(data)
+        questions = payload["people_also_ask"]
+        # Cache write overlaps with rendering
+        await asyncio.gather(
+            _set_cache_many_async({cache_key: {"questions": questions}, serp_key: payload}),
+            output_result_async(
+                {"command": "paa", "query": query, "questions": questions},
+                json_output,
+                output,
+                render_paa,
+                query,
+                items,
+            ),
         )
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @app.command
@@ -237,12 +254,15 @@ def related(
 ) -> None:
     """Get related searches."""
     cache_key = f"serper:related:{query}:{gl}"
+    # Related searches come from the same search call as a default SERP lookup
+    serp_key = f"serper:serp:{query}:10:{gl}"
 
     # Check cache
     if not no_cache:
-        cached = _get_cached(cache_key)
+        hits = _get_cached_many([cache_key, serp_key])
+        cached = hits.get(cache_key) or hits.get(serp_key)
         if cached:
-            items = cached["related_searches"]
+            items = cached.get("related_searches", [])
             output_result(
                 {"command": "related", "query": query, "related_searches": items, "cached": True},
                 json_output,
@@ -256,16 +276,21 @@ def related(
     src = _get_serper_source()
 
     async def _run() -> None:
-        items = await src.get_related(query, gl=gl)
-        # Cache result
-        _set_cache(cache_key, {"related_searches": items})
-        output_result(
-            {"command": "related", "query": query, "related_searches": items},
-            json_output,
-            output,
-            render_related,
-            query,
-            items,
+        async with src:
+            # Same search call as get_related(); keep the full SERP for the cache
+            data = await src.get_serp(query, num=10, gl=gl)
+        items = data.related_searches
+        # Cache write overlaps with rendering
+        await asyncio.gather(
+            _set_cache_many_async({cache_key: {"related_searches": items}, serp_key: _serp_payload(data)}),
+            output_result_async(
+                {"command": "related", "query": query, "related_searches": items},
+                json_output,
+                output,
+                render_related,
+                query,
+                items,
+            ),
         )
 
-    asyncio.run(_run())
+    run_async(_run())
@@ -1,14 +1,16 @@
 """Reddit research CLI commands."""
 
 import asyncio
+import re
 import sys
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
 from cyclopts import App, Parameter
 
-from .common import output_result
-from ..db import CacheRepository, get_session, init_db
+from .common import output_result, output_result_async, run_async
+from ..serialize import serialize_posts
+from ..db import CacheRepository, get_session
 from ..sources import RedditResearch, RedditPost
 from ..output import render_reddit
 
@@ -18,6 +20,9 @@ app = App(help="Reddit research commands")
 SortType = Literal["hot", "new", "rising", "top", "controversial"]
 PeriodType = Literal["hour", "day", "week", "month", "year", "all"]
 
+# Comma/whitespace separated tokens
+_TOKEN_RE = re.compile(r"[^,\s]+")
+
 # Reusable parameter types
 SubredditsOpt = Annotated[str, Parameter(name=["-s", "--subreddits"], help="Comma-separated subreddits")]
 SortOpt = Annotated[SortType, Parameter(name="--sort", help="Sort: hot, new, rising, top, controversial")]
@@ -33,15 +38,26 @@ CACHE_TTL = 12
 
 def _get_cached(cache_key: str) -> Any | None:
     """Get cached data if exists."""
-    init_db()
     with get_session() as session:
         repo = CacheRepository(session)
         return repo.get(cache_key)
 
 
+def _set_cache(cache_key: str, data: Any) -> None:
+    """Cache data with TTL."""
+    with get_session() as session:
+        repo = CacheRepository(session)
+        repo.set(cache_key, data, ttl_hours=CACHE_TTL)
+
+
+async def _set_cache_async(cache_key: str, data: Any) -> None:
+    """Cache data with TTL without blocking the event loop."""
+    await asyncio.to_thread(_set_cache, cache_key, data)
+
+
 def _parse_subreddits(subreddits: str) -> list[str]:
-    """Parse comma-separated subreddits string."""
-    return [s.strip().lower() for s in subreddits.split(",") if s.strip()]
+    """Parse comma-separated subreddits string (duplicates dropped)."""
+    return list(dict.fromkeys(_TOKEN_RE.findall(subreddits.lower())))
 
 
 @app.default
@@ -75,71 +91,52 @@ def reddit(
     if not no_cache:
         cached = _get_cached(cache_key)
         if cached:
-            posts = [RedditPost(**p) for p in cached["posts"]]
             output_result(
                 {
                     "command": "reddit",
                     "subreddits": sub_list,
                     "sort": sort,
                     "period": period,
-                    "count": len(posts),
+                    "count": len(cached["posts"]),
                     "posts": cached["posts"],
                     "cached": True,
                 },
                 json_output,
                 output,
-                render_reddit,
-                posts,
-                sub_list,
-                sort,
-                period,
+                lambda: render_reddit(
+                    [RedditPost(**p) for p in cached["posts"]], sub_list, sort, period
+                ),
             )
             return
 
     src = RedditResearch()
 
     async def _run() -> None:
-        posts = await src.fetch_posts(sub_list, sort=sort, period=period, limit=limit)
-
-        posts_data = [
-            {
-                "id": p.id,
-                "title": p.title,
-                "url": p.url,
-                "permalink": p.permalink,
-                "author": p.author,
-                "subreddit": p.subreddit,
-                "score": p.score,
-                "upvote_ratio": p.upvote_ratio,
-                "comments": p.comments,
-                "created_at": p.created_at.isoformat(),
-                "flair": p.flair,
-            }
-            for p in posts
-        ]
-
-        # Cache result
-        init_db()
-        with get_session() as session:
-            repo = CacheRepository(session)
-            repo.set(cache_key, {"posts": posts_data}, ttl_hours=CACHE_TTL)
-
-        output_result(
-            {
-                "command": "reddit",
-                "subreddits": sub_list,
-                "sort": sort,
-                "period": period,
-                "count": len(posts),
-                "posts": posts_data,
-            },
-            json_output,
-            output,
-            render_reddit,
-            posts,
-            sub_list,
-            sort,
-            period,
+        async with src:
+            posts = await src.fetch_posts(sub_list, sort=sort, period=period, limit=limit)
+
+        posts_data = serialize_posts(posts)
+
+        # Cache write overlaps with rendering
+        await asyncio.gather(
+            _set_cache_async(cache_key, {"posts": posts_data}),
+            output_result_async(
+                {
+                    "command": "reddit",
+                    "subreddits": sub_list,
+                    "sort": sort,
+                    "period": period,
+                    "count": len(posts),
+                    "posts": posts_data,
+                },
+                json_output,
+                output,
+                render_reddit,
+                posts,
+                sub_list,
+                sort,
+                period,
+            ),
         )
 
-    asyncio.run(_run())
+    run_async(_run())
@@ -1,15 +1,18 @@
 """YouTube research CLI commands."""
 
 import asyncio
+import functools
 import sys
 from pathlib import Path
 from typing import Annotated, Any
 
 from cyclopts import App, Parameter
 
-from .common import output_result
-from ..db import CacheRepository, get_session, init_db
+from .common import output_result, output_result_async, run_async
+from ..serialize import serialize_videos
+from ..db import CacheRepository, get_session
 from ..sources import YouTubeResearch
+from ..serper.client import VideoResult
 from ..output import render_youtube
 
 app = App(help="YouTube video research commands")
@@ -31,7 +34,6 @@ CACHE_TTL = 24
 
 def _get_cached(cache_key: str) -> Any | None:
     """Get cached data if exists."""
-    init_db()
     with get_session() as session:
         repo = CacheRepository(session)
         return repo.get(cache_key)
@@ -39,12 +41,17 @@ def _get_cached(cache_key: str) -> Any | None:
 
 def _set_cache(cache_key: str, data: Any) -> None:
     """Cache data with TTL."""
-    init_db()
     with get_session() as session:
         repo = CacheRepository(session)
         repo.set(cache_key, data, ttl_hours=CACHE_TTL)
 
 
+async def _set_cache_async(cache_key: str, data: Any) -> None:
+    """Cache data with TTL without blocking the event loop."""
+    await asyncio.to_thread(_set_cache, cache_key, data)
+
+
+@functools.cache
 def _get_youtube_source() -> YouTubeResearch:
     """Get YouTube research source."""
     from ..config import load_env_config
@@ -56,21 +63,9 @@ def _get_youtube_source() -> YouTubeResearch:
     return YouTubeResearch(api_key=api_key)
 
 
-def _videos_to_dict(videos: list) -> list[dict]:
-    """Convert VideoResult list to JSON-serializable dict list."""
-    return [
-        {
-            "position": v.position,
-            "title": v.title,
-            "link": v.link,
-            "snippet": v.snippet,
-            "channel": v.channel,
-            "duration": v.duration,
-            "views": v.views,
-            "date": v.date,
-        }
-        for v in videos
-    ]
+def _videos_from_cache(cached: dict[str, Any]) -> list[VideoResult]:
+    """Rebuild VideoResult list from its cached JSON shape."""
+    return [VideoResult(**v) for v in cached["videos"]]
 
 
 @app.command
@@ -89,8 +84,6 @@ def search(
     if not no_cache:
         cached = _get_cached(cache_key)
         if cached:
-            from ..serper.client import VideoResult
-            videos = [VideoResult(**v) for v in cached["videos"]]
             output_result(
                 {
                     "command": "youtube:search",
@@ -100,33 +93,34 @@ def search(
                 },
                 json_output,
                 output,
-                render_youtube,
-                cached["query"],
-                videos,
+                lambda: render_youtube(cached["query"], _videos_from_cache(cached)),
             )
             return
 
     src = _get_youtube_source()
 
     async def _run() -> None:
-        data = await src.search(query, limit=limit, region=region)
-        videos_dict = _videos_to_dict(data.videos)
-        # Cache result
-        _set_cache(cache_key, {"query": data.query, "videos": videos_dict})
-        output_result(
-            {
-                "command": "youtube:search",
-                "query": data.query,
-                "videos": videos_dict,
-            },
-            json_output,
-            output,
-            render_youtube,
-            data.query,
-            data.videos,
+        async with src:
+            data = await src.search(query, limit=limit, region=region)
+        videos_dict = serialize_videos(data.videos)
+        # Cache write overlaps with rendering
+        await asyncio.gather(
+            _set_cache_async(cache_key, {"query": data.query, "videos": videos_dict}),
+            output_result_async(
+                {
+                    "command": "youtube:search",
+                    "query": data.query,
+                    "videos": videos_dict,
+                },
+                json_output,
+                output,
+                render_youtube,
+                data.query,
+                data.videos,
+            ),
         )
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @app.command
@@ -145,8 +139,6 @@ def channel(
     if not no_cache:
         cached = _get_cached(cache_key)
         if cached:
-            from ..serper.client import VideoResult
-            videos = [VideoResult(**v) for v in cached["videos"]]
             output_result(
                 {
                     "command": "youtube:channel",
@@ -156,33 +148,34 @@ def channel(
                 },
                 json_output,
                 output,
-                render_youtube,
-                cached["query"],
-                videos,
+                lambda: render_youtube(cached["query"], _videos_from_cache(cached)),
             )
             return
 
     src = _get_youtube_source()
 
     async def _run() -> None:
-        data = await src.channel_videos(channel_name, limit=limit, region=region)
-        videos_dict = _videos_to_dict(data.videos)
-        # Cache result
-        _set_cache(cache_key, {"query": data.query, "videos": videos_dict})
-        output_result(
-            {
-                "command": "youtube:channel",
-                "channel": data.query,
-                "videos": videos_dict,
-            },
-            json_output,
-            output,
-            render_youtube,
-            data.query,
-            data.videos,
+        async with src:
+            data = await src.channel_videos(channel_name, limit=limit, region=region)
+        videos_dict = serialize_videos(data.videos)
+        # Cache write overlaps with rendering
+        await asyncio.gather(
+            _set_cache_async(cache_key, {"query": data.query, "videos": videos_dict}),
+            output_result_async(
+                {
+                    "command": "youtube:channel",
+                    "channel": data.query,
+                    "videos": videos_dict,
+                },
+                json_output,
+                output,
+                render_youtube,
+                data.query,
+                data.videos,
+            ),
         )
 
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @app.command
@@ -201,8 +194,6 @@ def trending(
     if not no_cache:
         cached = _get_cached(cache_key)
         if cached:
-            from ..serper.client import VideoResult
-            videos = [VideoResult(**v) for v in cached["videos"]]
             output_result(
                 {
                     "command": "youtube:trending",
@@ -213,31 +204,32 @@ def trending(
                 },
                 json_output,
                 output,
-                render_youtube,
-                cached.get("query", "trending"),
-                videos,
+                lambda: render_youtube(cached.get("query", "trending"), _videos_from_cache(cached)),
             )
             return
 
     src = _get_youtube_source()
 
     async def _run() -> None:
-        data = await src.trending(category=category, region=region, limit=limit)
-        videos_dict = _videos_to_dict(data.videos)
-        # Cache result
-        _set_cache(cache_key, {"query": data.query, "videos": videos_dict})
-        output_result(
-            {
-                "command": "youtube:trending",
-                "category": category,
-                "region": region,
-                "videos": videos_dict,
-            },
-            json_output,
-            output,
-            render_youtube,
-            data.query,
-            data.videos,
+        async with src:
+            data = await src.trending(category=category, region=region, limit=limit)
+        videos_dict = serialize_videos(data.videos)
+        # Cache write overlaps with rendering
+        await asyncio.gather(
+            _set_cache_async(cache_key, {"query": data.query, "videos": videos_dict}),
+            output_result_async(
+                {
+                    "command": "youtube:trending",
+                    "category": category,
+                    "region": region,
+                    "videos": videos_dict,
+                },
+                json_output,
+                output,
+                render_youtube,
+                data.query,
+                data.videos,
+            ),
         )
 
-    asyncio.run(_run())
+    run_async(_run())
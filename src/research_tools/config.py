@@ -1,13 +1,15 @@
 """Configuration loading for research-tools."""
 
+import functools
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 
+@functools.cache
 def load_env_config() -> dict[str, str | None]:
-    """Load environment config from .env file."""
+    """Load environment config from .env file (read once per process)."""
     env_path = Path(__file__).parent.parent.parent / ".env"
     if env_path.exists():
         load_dotenv(env_path)
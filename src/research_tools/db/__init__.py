@@ -1,6 +1,6 @@
 """Database module for research-tools."""
 
-from .connection import get_engine, init_db, create_session, get_session
+from .connection import get_engine, init_db, create_session, get_session, get_session_factory
 from .repositories import CacheRepository
 
 __all__ = [
@@ -8,5 +8,6 @@ __all__ = [
     "init_db",
     "create_session",
     "get_session",
+    "get_session_factory",
     "CacheRepository",
 ]
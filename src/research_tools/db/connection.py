@@ -4,12 +4,36 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
 
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, SQLModel, create_engine
 
 _DB_DIR = Path.home() / ".research-tools"
 _DB_PATH = _DB_DIR / "data.db"
 
 _engine = None
+_initialized = False
+_session_factory = None
+
+# Applied to every new SQLite connection. WAL lets readers run alongside a
+# writer (CLI + MCP server sharing one file); NORMAL sync is safe with WAL.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure journaling and memory pragmas on a new connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 def get_db_path() -> Path:
@@ -24,20 +48,43 @@ def get_engine():
     if _engine is None:
         db_path = get_db_path()
         _engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
     return _engine
 
 
 def init_db() -> None:
-    """Initialize database - create all tables."""
+    """Initialize database - create all tables (once per process)."""
+    global _initialized
+    if _initialized:
+        return
+
     from .models import CacheEntry  # noqa: F401
 
     SQLModel.metadata.create_all(get_engine())
+    _initialized = True
+
+
+def get_session_factory() -> sessionmaker:
+    """Get or create the session factory (singleton).
+
+    The schema is initialized once when the factory is first built, so
+    sessions handed out afterwards go straight to the query.
+    """
+    global _session_factory
+    if _session_factory is None:
+        init_db()
+        _session_factory = sessionmaker(
+            bind=get_engine(),
+            class_=Session,
+            expire_on_commit=False,
+        )
+    return _session_factory
 
 
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
     """Get a database session as context manager."""
-    session = Session(get_engine())
+    session = get_session_factory()()
     try:
         yield session
     finally:
@@ -46,4 +93,4 @@ def get_session() -> Generator[Session, None, None]:
 
 def create_session() -> Session:
     """Create a new session (caller responsible for closing)."""
-    return Session(get_engine())
+    return get_session_factory()()
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from sqlalchemy import LargeBinary
 from sqlmodel import Field, SQLModel
 
 
@@ -12,7 +13,7 @@ class CacheEntry(SQLModel, table=True):
 
     id: int | None = Field(default=None, primary_key=True)
     key: str = Field(index=True, unique=True)
-    data: str  # JSON serialized
+    data: bytes = Field(sa_type=LargeBinary)  # compressed JSON (legacy rows: JSON text)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     expires_at: datetime
 
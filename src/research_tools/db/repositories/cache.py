@@ -1,14 +1,57 @@
 """Cache repository for API response caching with TTL."""
 
-import json
+import zlib
 from datetime import datetime, timedelta
 from typing import Any
 
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select
 
+from ... import fastjson
 from ..models import CacheEntry
 from .base import BaseRepository
 
+# Format byte prefixed to stored payloads
+_FORMAT_ZLIB_JSON = b"\x01"  # zlib-compressed compact JSON
+_FORMAT_ZLIB_DICT_JSON = b"\x02"  # same, with the _ZDICT preset dictionary
+
+# Preset dictionary of fragments shared by cached payloads (JSON keys, URL
+# prefixes). Small payloads compress far better when these are not learned
+# from scratch. zlib favours the end of the dictionary, so the most common
+# fragments go last. Changing it requires a new format byte.
+_ZDICT = (
+    b'"flair":null,"created_at":"'
+    b'"upvote_ratio":"subreddit":"permalink":"https://reddit.com/r/'
+    b'"suggestions":["related_searches":["questions":[{"question":"'
+    b'"people_also_ask":[{"question":"'
+    b'"channel":"","duration":"","views":"","date":"'
+    b'"videos":[{"position":"posts":[{"id":"'
+    b'"author":"","url":"https://","score":,"comments":'
+    b'https://www.youtube.com/watch?v=https://en.wikipedia.org/wiki/'
+    b'"query":"","results":[{"position":'
+    b',"title":"","link":"https://www.","snippet":"'
+)
+
+
+def _encode(data: Any) -> bytes:
+    """Serialize data into a compressed cache payload."""
+    raw = fastjson.dumps(data)
+    compressor = zlib.compressobj(zdict=_ZDICT)
+    return _FORMAT_ZLIB_DICT_JSON + compressor.compress(raw) + compressor.flush()
+
+
+def _decode(payload: bytes | str) -> Any:
+    """Deserialize a cache payload (compressed or legacy JSON text)."""
+    if isinstance(payload, str):
+        return fastjson.loads(payload)
+    fmt = payload[:1]
+    if fmt == _FORMAT_ZLIB_DICT_JSON:
+        decompressor = zlib.decompressobj(zdict=_ZDICT)
+        return fastjson.loads(decompressor.decompress(payload[1:]) + decompressor.flush())
+    if fmt == _FORMAT_ZLIB_JSON:
+        return fastjson.loads(zlib.decompress(payload[1:]))
+    raise ValueError(f"Unknown cache payload format: {fmt!r}")
+
 
 class CacheRepository(BaseRepository[CacheEntry]):
     """Repository for cache operations with TTL support."""
@@ -29,7 +72,35 @@ class CacheRepository(BaseRepository[CacheEntry]):
             self.session.commit()
             return None
 
-        return json.loads(entry.data)
+        return _decode(entry.data)
+
+    def peek(self, key: str) -> tuple[Any, datetime, datetime] | None:
+        """Get cached data with its created_at/expires_at, even if expired.
+
+        Expired entries are not deleted (they stay until cleanup()) so they
+        can serve as a stale fallback.
+        """
+        stmt = select(CacheEntry).where(CacheEntry.key == key)
+        entry = self.session.exec(stmt).first()
+
+        if entry is None:
+            return None
+        return _decode(entry.data), entry.created_at, entry.expires_at
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get cached data for several keys in one query.
+
+        Expired entries are filtered out in SQL and left for cleanup().
+        Returns a dict of key -> data containing only the keys that hit.
+        """
+        if not keys:
+            return {}
+
+        stmt = select(CacheEntry).where(
+            CacheEntry.key.in_(keys),
+            CacheEntry.expires_at > datetime.utcnow(),
+        )
+        return {entry.key: _decode(entry.data) for entry in self.session.exec(stmt)}
 
     def set(self, key: str, data: Any, ttl_hours: int = 24) -> CacheEntry:
         """Set cache data with TTL."""
@@ -40,7 +111,7 @@ class CacheRepository(BaseRepository[CacheEntry]):
         expires_at = now + timedelta(hours=ttl_hours)
 
         if existing:
-            existing.data = json.dumps(data)
+            existing.data = _encode(data)
             existing.created_at = now
             existing.expires_at = expires_at
             self.session.commit()
@@ -49,12 +120,40 @@ class CacheRepository(BaseRepository[CacheEntry]):
 
         entry = CacheEntry(
             key=key,
-            data=json.dumps(data),
+            data=_encode(data),
             created_at=now,
             expires_at=expires_at,
         )
         return self.create(entry)
 
+    def set_many(self, items: dict[str, Any], ttl_hours: int = 24) -> int:
+        """Set several cache entries in one transaction (upsert).
+
+        Returns count of entries written.
+        """
+        if not items:
+            return 0
+
+        now = datetime.utcnow()
+        expires_at = now + timedelta(hours=ttl_hours)
+        rows = [
+            {"key": key, "data": _encode(data), "created_at": now, "expires_at": expires_at}
+            for key, data in items.items()
+        ]
+
+        stmt = sqlite_insert(CacheEntry).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "data": stmt.excluded.data,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        self.session.exec(stmt)
+        self.session.commit()
+        return len(rows)
+
     def invalidate(self, key: str) -> bool:
         """Remove a specific cache entry."""
         stmt = select(CacheEntry).where(CacheEntry.key == key)
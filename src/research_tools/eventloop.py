@@ -0,0 +1,26 @@
+"""Event loop selection: uvloop when installed, stdlib asyncio otherwise."""
+
+import asyncio
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, preferring uvloop when installed."""
+    if uvloop is None:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def setup_event_loop() -> None:
+    """Make uvloop the process-wide event loop when installed.
+
+    For entrypoints whose loop is created by a library (e.g. the MCP server);
+    call it before the loop starts. Code that creates its own loop should
+    pass new_event_loop as the loop factory instead.
+    """
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -1,8 +1,10 @@
 """MCP server entry point for research-tools."""
 
+from ..eventloop import setup_event_loop
 from .server import mcp
 
 
 def main() -> None:
-    """Run the MCP server."""
+    """Run the MCP server (on uvloop when installed)."""
+    setup_event_loop()
     mcp.run()
@@ -1,44 +1,93 @@
 """MCP server implementation for research-tools."""
 
-from collections import defaultdict
-from typing import Any, Literal
+import functools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Literal
 
 from fastmcp import FastMCP
 
+from ..cache import cached, canonical, coalesce
 from ..config import load_env_config
-from ..db import CacheRepository, get_session, init_db
+from ..serialize import (
+    serialize_articles,
+    serialize_organic,
+    serialize_paa,
+    serialize_posts,
+    serialize_videos,
+)
+from ..serper import aclose_shared_client
 from ..sources import (
     DevToResearch,
     SerperResearch,
     RedditResearch,
     YouTubeResearch,
-    Article,
-    TagStats,
-    AuthorStats,
+    aggregate_tags,
+    aggregate_authors,
 )
 
-mcp = FastMCP("research-tools")
 
-# Cache TTLs (hours)
-SERPER_CACHE_TTL = 48
-REDDIT_CACHE_TTL = 12
-YOUTUBE_CACHE_TTL = 24
+# Sources are created once per API key so their HTTP connection pools are
+# reused across tool calls; they are closed when the server shuts down.
+_sources: list[SerperResearch | YouTubeResearch | DevToResearch | RedditResearch] = []
+
+
+@functools.cache
+def _serper_source(api_key: str) -> SerperResearch:
+    """Get the process-wide Serper source for an API key."""
+    src = SerperResearch(api_key=api_key)
+    _sources.append(src)
+    return src
+
+
+@functools.cache
+def _devto_source() -> DevToResearch:
+    """Get the process-wide dev.to source."""
+    env = load_env_config()
+    src = DevToResearch(api_key=env.get("devto_api_key") or "")
+    _sources.append(src)
+    return src
+
+
+@functools.cache
+def _reddit_source() -> RedditResearch:
+    """Get the process-wide Reddit source."""
+    src = RedditResearch()
+    _sources.append(src)
+    return src
+
+
+@functools.cache
+def _youtube_source(api_key: str) -> YouTubeResearch:
+    """Get the process-wide YouTube source for an API key."""
+    src = YouTubeResearch(api_key=api_key)
+    _sources.append(src)
+    return src
 
 
-def _get_cached(cache_key: str) -> Any | None:
-    """Get cached data if exists."""
-    init_db()
-    with get_session() as session:
-        repo = CacheRepository(session)
-        return repo.get(cache_key)
+def _serper() -> SerperResearch | None:
+    """Get the Serper source, or None if SERPER_API_KEY is not configured."""
+    api_key = load_env_config().get("serper_api_key")
+    return _serper_source(api_key) if api_key else None
 
 
-def _set_cache(cache_key: str, data: Any, ttl_hours: int = 24) -> None:
-    """Cache data with TTL."""
-    init_db()
-    with get_session() as session:
-        repo = CacheRepository(session)
-        repo.set(cache_key, data, ttl_hours=ttl_hours)
+def _youtube() -> YouTubeResearch | None:
+    """Get the YouTube source, or None if SERPER_API_KEY is not configured."""
+    api_key = load_env_config().get("serper_api_key")
+    return _youtube_source(api_key) if api_key else None
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close pooled HTTP clients when the server shuts down."""
+    try:
+        yield
+    finally:
+        for src in _sources:
+            await src.aclose()
+        await aclose_shared_client()
+
+
+mcp = FastMCP("research-tools", lifespan=_lifespan)
 
 
 # =============================================================================
@@ -46,7 +95,17 @@ def _set_cache(cache_key: str, data: Any, ttl_hours: int = 24) -> None:
 # =============================================================================
 
 
+def _devto_key(tool: str):
+    """Build a coalescing key function for a dev.to tool."""
+
+    def key_fn(tags: str | None, period: int, limit: int, **_) -> tuple:
+        return ("devto", tool, canonical(tags or ""), period, limit)
+
+    return key_fn
+
+
 @mcp.tool()
+@coalesce(_devto_key("trending"))
 async def devto_trending(
     tags: str | None = None,
     period: int = 7,
@@ -63,8 +122,7 @@ async def devto_trending(
     Returns:
         Trending articles with engagement metrics
     """
-    env = load_env_config()
-    src = DevToResearch(api_key=env.get("devto_api_key") or "")
+    src = _devto_source()
 
     tag_list = None
     if tags:
@@ -77,24 +135,12 @@ async def devto_trending(
         "period": period,
         "tags": tag_list,
         "count": len(articles),
-        "articles": [
-            {
-                "id": a.id,
-                "title": a.title,
-                "url": a.url,
-                "author": a.author,
-                "reactions": a.reactions,
-                "comments": a.comments,
-                "reading_time": a.reading_time,
-                "tags": a.tags,
-                "published_at": a.published_at.isoformat(),
-            }
-            for a in articles
-        ],
+        "articles": serialize_articles(articles),
     }
 
 
 @mcp.tool()
+@coalesce(_devto_key("tags"))
 async def devto_tags(
     tags: str,
     period: int = 7,
@@ -115,45 +161,17 @@ async def devto_tags(
     if not tag_list:
         return {"error": "tags parameter is required"}
 
-    env = load_env_config()
-    src = DevToResearch(api_key=env.get("devto_api_key") or "")
+    src = _devto_source()
     sample_size = max(100, limit * 10)
 
-    articles = await src.fetch_articles(tags=tag_list, period=period, limit=sample_size)
-
-    # Aggregate by tag
-    tag_data: dict[str, list[Article]] = defaultdict(list)
-    for article in articles:
-        for tag in article.tags:
-            if tag in tag_list:
-                tag_data[tag].append(article)
-
-    # Calculate stats
-    tag_stats: list[TagStats] = []
-    for tag_name in tag_list:
-        tag_articles = tag_data.get(tag_name, [])
-        if not tag_articles:
-            continue
-
-        count = len(tag_articles)
-        total_reactions = sum(a.reactions for a in tag_articles)
-        total_comments = sum(a.comments for a in tag_articles)
-        total_reading = sum(a.reading_time for a in tag_articles)
-
-        tag_stats.append(
-            TagStats(
-                name=tag_name,
-                article_count=count,
-                total_reactions=total_reactions,
-                total_comments=total_comments,
-                avg_reactions=total_reactions / count,
-                avg_comments=total_comments / count,
-                avg_reading_time=total_reading / count,
-            )
-        )
-
-    tag_stats.sort(key=lambda t: t.avg_reactions, reverse=True)
-    tag_stats = tag_stats[:limit]
+    # Full sample, round-robin across tags so each tag is represented
+    articles = [
+        article
+        async for page in src.iter_articles(tags=tag_list, period=period, limit=sample_size)
+        for article in page
+    ]
+
+    tag_stats = aggregate_tags(articles, tag_list, limit)
 
     return {
         "source": "devto",
@@ -175,6 +193,7 @@ async def devto_tags(
 
 
 @mcp.tool()
+@coalesce(_devto_key("authors"))
 async def devto_authors(
     tags: str | None = None,
     period: int = 7,
@@ -195,37 +214,17 @@ async def devto_authors(
     if tags:
         tag_list = [t.strip() for t in tags.split(",") if t.strip()]
 
-    env = load_env_config()
-    src = DevToResearch(api_key=env.get("devto_api_key") or "")
+    src = _devto_source()
     sample_size = max(100, limit * 10)
 
-    articles = await src.fetch_articles(tags=tag_list, period=period, limit=sample_size)
-
-    # Aggregate by author
-    author_data: dict[str, list[Article]] = defaultdict(list)
-    for article in articles:
-        author_data[article.author].append(article)
-
-    # Calculate stats
-    author_stats: list[AuthorStats] = []
-    for username, user_articles in author_data.items():
-        count = len(user_articles)
-        total_reactions = sum(a.reactions for a in user_articles)
-        total_comments = sum(a.comments for a in user_articles)
-
-        author_stats.append(
-            AuthorStats(
-                username=username,
-                article_count=count,
-                total_reactions=total_reactions,
-                total_comments=total_comments,
-                avg_reactions=total_reactions / count,
-                articles=user_articles,
-            )
-        )
-
-    author_stats.sort(key=lambda a: a.total_reactions, reverse=True)
-    author_stats = author_stats[:limit]
+    # Full sample, round-robin across tags so each tag is represented
+    articles = [
+        article
+        async for page in src.iter_articles(tags=tag_list, period=period, limit=sample_size)
+        for article in page
+    ]
+
+    author_stats = aggregate_authors(articles, limit)
 
     return {
         "source": "devto",
@@ -250,7 +249,21 @@ async def devto_authors(
 # =============================================================================
 
 
+def _echo(*names: str) -> Callable[..., dict]:
+    """hit_overlay that echoes this call's arguments over a cached result."""
+
+    def overlay(**arguments) -> dict:
+        return {name: arguments[name] for name in names}
+
+    return overlay
+
+
 @mcp.tool()
+@cached(
+    "long",
+    key_fn=lambda query, **_: ("serper", "keywords", canonical(query)),
+    hit_overlay=_echo("query"),
+)
 async def google_keywords(
     query: str,
     no_cache: bool = False,
@@ -265,32 +278,21 @@ async def google_keywords(
     Returns:
         List of keyword suggestions
     """
-    cache_key = f"serper:keywords:{query}"
-
-    if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
-            return {
-                "query": cached["query"],
-                "suggestions": cached["suggestions"],
-                "cached": True,
-            }
-
-    env = load_env_config()
-    api_key = env.get("serper_api_key")
-    if not api_key:
+    src = _serper()
+    if src is None:
         return {"error": "SERPER_API_KEY not configured"}
 
-    src = SerperResearch(api_key=api_key)
     data = await src.get_keywords(query)
 
-    result = {"query": data.query, "suggestions": data.suggestions}
-    _set_cache(cache_key, result, ttl_hours=SERPER_CACHE_TTL)
-
-    return result
+    return {"query": data.query, "suggestions": data.suggestions}
 
 
 @mcp.tool()
+@cached(
+    "long",
+    key_fn=lambda query, num, gl, **_: ("serper", "serp", canonical(query), num, gl.lower()),
+    hit_overlay=_echo("query"),
+)
 async def google_serp(
     query: str,
     num: int = 10,
@@ -309,44 +311,26 @@ async def google_serp(
     Returns:
         SERP analysis with organic results
     """
-    cache_key = f"serper:serp:{query}:{num}:{gl}"
-
-    if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
-            return {**cached, "cached": True}
-
-    env = load_env_config()
-    api_key = env.get("serper_api_key")
-    if not api_key:
+    src = _serper()
+    if src is None:
         return {"error": "SERPER_API_KEY not configured"}
 
-    src = SerperResearch(api_key=api_key)
     data = await src.get_serp(query, num=num, gl=gl)
 
-    result = {
+    return {
         "query": data.query,
-        "results": [
-            {
-                "position": r.position,
-                "title": r.title,
-                "link": r.link,
-                "snippet": r.snippet,
-            }
-            for r in data.results
-        ],
-        "people_also_ask": [
-            {"question": p.question, "snippet": p.snippet, "link": p.link}
-            for p in data.people_also_ask
-        ],
+        "results": serialize_organic(data.results),
+        "people_also_ask": serialize_paa(data.people_also_ask),
         "related_searches": data.related_searches,
     }
-    _set_cache(cache_key, result, ttl_hours=SERPER_CACHE_TTL)
-
-    return result
 
 
 @mcp.tool()
+@cached(
+    "long",
+    key_fn=lambda query, gl, **_: ("serper", "paa", canonical(query), gl.lower()),
+    hit_overlay=_echo("query"),
+)
 async def google_paa(
     query: str,
     gl: str = "us",
@@ -363,34 +347,24 @@ async def google_paa(
     Returns:
         List of PAA questions with snippets
     """
-    cache_key = f"serper:paa:{query}:{gl}"
-
-    if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
-            return {**cached, "query": query, "cached": True}
-
-    env = load_env_config()
-    api_key = env.get("serper_api_key")
-    if not api_key:
+    src = _serper()
+    if src is None:
         return {"error": "SERPER_API_KEY not configured"}
 
-    src = SerperResearch(api_key=api_key)
     items = await src.get_paa(query, gl=gl)
 
-    result = {
+    return {
         "query": query,
-        "questions": [
-            {"question": i.question, "snippet": i.snippet, "link": i.link}
-            for i in items
-        ],
+        "questions": serialize_paa(items),
     }
-    _set_cache(cache_key, result, ttl_hours=SERPER_CACHE_TTL)
-
-    return result
 
 
 @mcp.tool()
+@cached(
+    "long",
+    key_fn=lambda query, gl, **_: ("serper", "related", canonical(query), gl.lower()),
+    hit_overlay=_echo("query"),
+)
 async def google_related(
     query: str,
     gl: str = "us",
@@ -407,25 +381,13 @@ async def google_related(
     Returns:
         List of related search queries
     """
-    cache_key = f"serper:related:{query}:{gl}"
-
-    if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
-            return {**cached, "query": query, "cached": True}
-
-    env = load_env_config()
-    api_key = env.get("serper_api_key")
-    if not api_key:
+    src = _serper()
+    if src is None:
         return {"error": "SERPER_API_KEY not configured"}
 
-    src = SerperResearch(api_key=api_key)
     items = await src.get_related(query, gl=gl)
 
-    result = {"query": query, "related_searches": items}
-    _set_cache(cache_key, result, ttl_hours=SERPER_CACHE_TTL)
-
-    return result
+    return {"query": query, "related_searches": items}
 
 
 # =============================================================================
@@ -436,7 +398,36 @@ SortType = Literal["hot", "new", "rising", "top", "controversial"]
 PeriodType = Literal["hour", "day", "week", "month", "year", "all"]
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_subreddits(subreddits: str) -> tuple[str, ...]:
+    """Parse comma-separated subreddits into unique normalized names (memoized).
+
+    Duplicates are dropped here, keeping first-seen order, so the cache key
+    and the fetched subreddits always agree.
+    """
+    return tuple(dict.fromkeys(s.strip().lower() for s in subreddits.split(",") if s.strip()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _reddit_cache_key(subreddits: str, sort: str, period: str, limit: int) -> tuple | None:
+    """Cache key for reddit_posts (None when no subreddits are given), memoized."""
+    sub_list = _parse_subreddits(subreddits)
+    if not sub_list:
+        return None
+    return ("reddit", ",".join(sorted(sub_list)), sort, period, limit)
+
+
+def _reddit_key(subreddits: str, sort: str, period: str, limit: int, **_) -> tuple | None:
+    """key_fn for reddit_posts."""
+    return _reddit_cache_key(subreddits, sort, period, limit)
+
+
 @mcp.tool()
+@cached(
+    "short",
+    key_fn=_reddit_key,
+    hit_overlay=lambda subreddits, **_: {"subreddits": list(_parse_subreddits(subreddits))},
+)
 async def reddit_posts(
     subreddits: str,
     sort: SortType = "hot",
@@ -457,47 +448,20 @@ async def reddit_posts(
     Returns:
         Reddit posts sorted by score
     """
-    sub_list = [s.strip().lower() for s in subreddits.split(",") if s.strip()]
+    sub_list = list(_parse_subreddits(subreddits))
     if not sub_list:
         return {"error": "subreddits parameter is required"}
 
-    cache_key = f"reddit:{','.join(sorted(sub_list))}:{sort}:{period}:{limit}"
-
-    if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
-            return {**cached, "cached": True}
-
-    src = RedditResearch()
+    src = _reddit_source()
     posts = await src.fetch_posts(sub_list, sort=sort, period=period, limit=limit)
 
-    posts_data = [
-        {
-            "id": p.id,
-            "title": p.title,
-            "url": p.url,
-            "permalink": p.permalink,
-            "author": p.author,
-            "subreddit": p.subreddit,
-            "score": p.score,
-            "upvote_ratio": p.upvote_ratio,
-            "comments": p.comments,
-            "created_at": p.created_at.isoformat(),
-            "flair": p.flair,
-        }
-        for p in posts
-    ]
-
-    result = {
+    return {
         "subreddits": sub_list,
         "sort": sort,
         "period": period,
         "count": len(posts),
-        "posts": posts_data,
+        "posts": serialize_posts(posts),
     }
-    _set_cache(cache_key, result, ttl_hours=REDDIT_CACHE_TTL)
-
-    return result
 
 
 # =============================================================================
@@ -505,24 +469,23 @@ async def reddit_posts(
 # =============================================================================
 
 
-def _videos_to_dict(videos: list) -> list[dict]:
-    """Convert VideoResult list to JSON-serializable dict list."""
-    return [
-        {
-            "position": v.position,
-            "title": v.title,
-            "link": v.link,
-            "snippet": v.snippet,
-            "channel": v.channel,
-            "duration": v.duration,
-            "views": v.views,
-            "date": v.date,
-        }
-        for v in videos
-    ]
+def _youtube_search_key(query: str, limit: int, region: str, **_) -> tuple:
+    """Cache key for youtube_search."""
+    return ("youtube", "search", canonical(query), limit, region.lower())
+
+
+def _youtube_channel_key(channel: str, limit: int, region: str, **_) -> tuple:
+    """Cache key for youtube_channel."""
+    return ("youtube", "channel", canonical(channel), limit, region.lower())
+
+
+def _youtube_trending_key(category: str | None, region: str, limit: int, **_) -> tuple:
+    """Cache key for youtube_trending."""
+    return ("youtube", "trending", category or "all", region.lower(), limit)
 
 
 @mcp.tool()
+@cached("normal", key_fn=_youtube_search_key, hit_overlay=_echo("query"))
 async def youtube_search(
     query: str,
     limit: int = 20,
@@ -541,29 +504,18 @@ async def youtube_search(
     Returns:
         List of YouTube videos with metadata
     """
-    cache_key = f"youtube:search:{query}:{limit}:{region}"
-
-    if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
-            return {**cached, "cached": True}
-
-    env = load_env_config()
-    api_key = env.get("serper_api_key")
-    if not api_key:
+    src = _youtube()
+    if src is None:
         return {"error": "SERPER_API_KEY not configured"}
 
-    src = YouTubeResearch(api_key=api_key)
     data = await src.search(query, limit=limit, region=region)
-    videos_dict = _videos_to_dict(data.videos)
-
-    result = {"query": data.query, "count": len(videos_dict), "videos": videos_dict}
-    _set_cache(cache_key, result, ttl_hours=YOUTUBE_CACHE_TTL)
+    videos_dict = serialize_videos(data.videos)
 
-    return result
+    return {"query": data.query, "count": len(videos_dict), "videos": videos_dict}
 
 
 @mcp.tool()
+@cached("normal", key_fn=_youtube_channel_key, hit_overlay=_echo("channel"))
 async def youtube_channel(
     channel: str,
     limit: int = 20,
@@ -582,29 +534,18 @@ async def youtube_channel(
     Returns:
         List of videos from the channel
     """
-    cache_key = f"youtube:channel:{channel}:{limit}:{region}"
-
-    if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
-            return {**cached, "cached": True}
-
-    env = load_env_config()
-    api_key = env.get("serper_api_key")
-    if not api_key:
+    src = _youtube()
+    if src is None:
         return {"error": "SERPER_API_KEY not configured"}
 
-    src = YouTubeResearch(api_key=api_key)
     data = await src.channel_videos(channel, limit=limit, region=region)
-    videos_dict = _videos_to_dict(data.videos)
-
-    result = {"channel": channel, "count": len(videos_dict), "videos": videos_dict}
-    _set_cache(cache_key, result, ttl_hours=YOUTUBE_CACHE_TTL)
+    videos_dict = serialize_videos(data.videos)
 
-    return result
+    return {"channel": channel, "count": len(videos_dict), "videos": videos_dict}
 
 
 @mcp.tool()
+@cached("normal", key_fn=_youtube_trending_key, hit_overlay=_echo("region"))
 async def youtube_trending(
     category: str | None = None,
     region: str = "us",
@@ -623,28 +564,16 @@ async def youtube_trending(
     Returns:
         List of trending videos
     """
-    cache_key = f"youtube:trending:{category or 'all'}:{region}:{limit}"
-
-    if not no_cache:
-        cached = _get_cached(cache_key)
-        if cached:
-            return {**cached, "cached": True}
-
-    env = load_env_config()
-    api_key = env.get("serper_api_key")
-    if not api_key:
+    src = _youtube()
+    if src is None:
         return {"error": "SERPER_API_KEY not configured"}
 
-    src = YouTubeResearch(api_key=api_key)
     data = await src.trending(category=category, region=region, limit=limit)
-    videos_dict = _videos_to_dict(data.videos)
+    videos_dict = serialize_videos(data.videos)
 
-    result = {
+    return {
         "category": category,
         "region": region,
         "count": len(videos_dict),
         "videos": videos_dict,
     }
-    _set_cache(cache_key, result, ttl_hours=YOUTUBE_CACHE_TTL)
-
-    return result
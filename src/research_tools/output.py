@@ -17,6 +17,63 @@ if sys.platform == "win32":
 
 console = Console(force_terminal=True)
 
+# Column specs per table: (header, Table.add_column kwargs)
+ColumnSpec = tuple[tuple[str, dict], ...]
+
+_TRENDING_COLUMNS: ColumnSpec = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Title", {"style": "bold", "max_width": 50, "overflow": "ellipsis"}),
+    ("Author", {"style": "cyan"}),
+    ("Reactions", {"justify": "right", "style": "green"}),
+    ("Comments", {"justify": "right", "style": "yellow"}),
+    ("Read", {"justify": "right"}),
+    ("Tags", {"style": "dim", "max_width": 30, "overflow": "ellipsis"}),
+)
+
+_TAGS_COLUMNS: ColumnSpec = (
+    ("Tag", {"style": "bold cyan"}),
+    ("Articles", {"justify": "right"}),
+    ("Avg Reactions", {"justify": "right", "style": "green"}),
+    ("Avg Comments", {"justify": "right", "style": "yellow"}),
+    ("Avg Read Time", {"justify": "right"}),
+)
+
+_AUTHORS_COLUMNS: ColumnSpec = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Author", {"style": "bold cyan"}),
+    ("Articles", {"justify": "right"}),
+    ("Total Reactions", {"justify": "right", "style": "green"}),
+    ("Avg Reactions", {"justify": "right", "style": "green"}),
+    ("Total Comments", {"justify": "right", "style": "yellow"}),
+)
+
+_REDDIT_COLUMNS: ColumnSpec = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Title", {"style": "bold", "max_width": 50, "overflow": "ellipsis"}),
+    ("Subreddit", {"style": "cyan"}),
+    ("Score", {"justify": "right", "style": "green"}),
+    ("Ratio", {"justify": "right", "style": "yellow"}),
+    ("Comments", {"justify": "right"}),
+    ("Author", {"style": "dim"}),
+)
+
+_YOUTUBE_COLUMNS: ColumnSpec = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Title", {"style": "bold", "max_width": 45, "overflow": "ellipsis"}),
+    ("Channel", {"style": "cyan", "max_width": 18, "overflow": "ellipsis"}),
+    ("Duration", {"justify": "right"}),
+    ("Views", {"justify": "right", "style": "green"}),
+    ("Date", {"style": "dim"}),
+)
+
+
+def _build_table(title: str, columns: ColumnSpec) -> Table:
+    """Create a table with the given column specs."""
+    table = Table(title=title, show_lines=False)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
 
 def render_trending(
     articles: list[Article],
@@ -28,21 +85,9 @@ def render_trending(
     if tags:
         title += f" - {', '.join(tags)}"
 
-    table = Table(title=title, show_lines=False)
-
-    table.add_column("#", style="dim", width=3)
-    table.add_column("Title", style="bold", max_width=50, overflow="ellipsis")
-    table.add_column("Author", style="cyan")
-    table.add_column("Reactions", justify="right", style="green")
-    table.add_column("Comments", justify="right", style="yellow")
-    table.add_column("Read", justify="right")
-    table.add_column("Tags", style="dim", max_width=30, overflow="ellipsis")
+    table = _build_table(title, _TRENDING_COLUMNS)
 
     for i, article in enumerate(articles, 1):
-        tags_str = ", ".join(article.tags[:3])
-        if len(article.tags) > 3:
-            tags_str += "..."
-
         table.add_row(
             str(i),
             article.title,
@@ -50,7 +95,7 @@ def render_trending(
             f"{article.reactions:,}",
             f"{article.comments:,}",
             f"{article.reading_time}min",
-            tags_str,
+            article.display_tags,
         )
 
     console.print()
@@ -65,17 +110,11 @@ def render_tags(
     period: int,
 ) -> None:
     """Render tag analysis as Rich table."""
-    table = Table(
-        title=f"Tag Analysis ({period}d, {sample_size} articles sampled)",
-        show_lines=False,
+    table = _build_table(
+        f"Tag Analysis ({period}d, {sample_size} articles sampled)",
+        _TAGS_COLUMNS,
     )
 
-    table.add_column("Tag", style="bold cyan")
-    table.add_column("Articles", justify="right")
-    table.add_column("Avg Reactions", justify="right", style="green")
-    table.add_column("Avg Comments", justify="right", style="yellow")
-    table.add_column("Avg Read Time", justify="right")
-
     for stats in tag_stats:
         table.add_row(
             stats.name,
@@ -101,14 +140,7 @@ def render_authors(
     if tags:
         title = f"Top Authors - {', '.join(tags)} ({period}d)"
 
-    table = Table(title=title, show_lines=False)
-
-    table.add_column("#", style="dim", width=3)
-    table.add_column("Author", style="bold cyan")
-    table.add_column("Articles", justify="right")
-    table.add_column("Total Reactions", justify="right", style="green")
-    table.add_column("Avg Reactions", justify="right", style="green")
-    table.add_column("Total Comments", justify="right", style="yellow")
+    table = _build_table(title, _AUTHORS_COLUMNS)
 
     for i, stats in enumerate(author_stats, 1):
         table.add_row(
@@ -206,15 +238,7 @@ def render_reddit(
     if period and sort in ("top", "controversial"):
         title += f" ({period})"
 
-    table = Table(title=title, show_lines=False)
-
-    table.add_column("#", style="dim", width=3)
-    table.add_column("Title", style="bold", max_width=50, overflow="ellipsis")
-    table.add_column("Subreddit", style="cyan")
-    table.add_column("Score", justify="right", style="green")
-    table.add_column("Ratio", justify="right", style="yellow")
-    table.add_column("Comments", justify="right")
-    table.add_column("Author", style="dim")
+    table = _build_table(title, _REDDIT_COLUMNS)
 
     for i, post in enumerate(posts, 1):
         table.add_row(
@@ -238,14 +262,7 @@ def render_youtube(
     videos: list[VideoResult],
 ) -> None:
     """Render YouTube videos as Rich table."""
-    table = Table(title=f"YouTube: {query}", show_lines=False)
-
-    table.add_column("#", style="dim", width=3)
-    table.add_column("Title", style="bold", max_width=45, overflow="ellipsis")
-    table.add_column("Channel", style="cyan", max_width=18, overflow="ellipsis")
-    table.add_column("Duration", justify="right")
-    table.add_column("Views", justify="right", style="green")
-    table.add_column("Date", style="dim")
+    table = _build_table(f"YouTube: {query}", _YOUTUBE_COLUMNS)
 
     for video in videos:
         pos_style = "green" if video.position <= 3 else "yellow" if video.position <= 10 else "dim"
@@ -0,0 +1,107 @@
+"""Async rate limiting for outbound API calls."""
+
+import asyncio
+import random
+import time
+from typing import Mapping
+
+import httpx
+
+# Statuses worth retrying after a backoff
+RETRY_STATUSES = frozenset({429, 503})
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """Token bucket limiter: refills `rate` tokens/second, holds up to `burst`."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Throttle to the budget advertised in X-RateLimit-Remaining/Reset."""
+        remaining = _header_float(headers, "x-ratelimit-remaining")
+        if remaining is None:
+            return
+        self._refill()
+        self._tokens = min(self._tokens, remaining)
+        reset = _header_float(headers, "x-ratelimit-reset")
+        if remaining < 1 and reset:
+            # Some APIs send an epoch timestamp, others seconds until reset
+            if reset > 1e9:
+                reset -= time.time()
+            self._resume_at = max(self._resume_at, time.monotonic() + reset)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it (rate <= 0 disables)."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            pause = self._resume_at - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = 0.5,
+    cap: float = 30.0,
+    retry_after: str | None = None,
+) -> float:
+    """Seconds to wait before retry `attempt` (0-based), with full jitter.
+
+    A numeric Retry-After header takes precedence when present.
+    """
+    if retry_after is not None:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+async def get_with_retry(
+    client: httpx.AsyncClient,
+    bucket: TokenBucket,
+    url: str,
+    retries: int = 3,
+    **kwargs,
+) -> httpx.Response:
+    """GET through the limiter, retrying 429/503 with exponential backoff.
+
+    Raises:
+        httpx.HTTPStatusError: On a non-2xx response once retries run out
+    """
+    for attempt in range(retries + 1):
+        await bucket.acquire()
+        response = await client.get(url, **kwargs)
+        bucket.update_from_headers(response.headers)
+        if response.status_code not in RETRY_STATUSES or attempt == retries:
+            break
+        await asyncio.sleep(backoff_delay(attempt, retry_after=response.headers.get("retry-after")))
+    response.raise_for_status()
+    return response
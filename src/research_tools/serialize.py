@@ -0,0 +1,55 @@
+"""JSON-ready serialization of source results, shared by the CLI and MCP server.
+
+Each result type has a fixed field order (matching the cached shape) and a
+precompiled attrgetter, so rows are built with one C-level call per item.
+"""
+
+from operator import attrgetter
+from typing import Any, Iterable
+
+from .serper.client import OrganicResult, PeopleAlsoAsk, VideoResult
+from .sources.base import Article
+from .sources.reddit import RedditPost
+
+_ORGANIC_FIELDS = ("position", "title", "link", "snippet")
+_PAA_FIELDS = ("question", "snippet", "link")
+_VIDEO_FIELDS = ("position", "title", "link", "snippet", "channel", "duration", "views", "date")
+_ARTICLE_FIELDS = (
+    "id", "title", "url", "author", "reactions", "comments", "reading_time", "tags", "published_at",
+)
+_POST_FIELDS = (
+    "id", "title", "url", "permalink", "author", "subreddit",
+    "score", "upvote_ratio", "comments", "created_at", "flair",
+)
+
+_organic_values = attrgetter(*_ORGANIC_FIELDS)
+_paa_values = attrgetter(*_PAA_FIELDS)
+_video_values = attrgetter(*_VIDEO_FIELDS)
+# Timestamps come from the strings formatted at parse time
+_article_values = attrgetter(*_ARTICLE_FIELDS[:-1], "published_at_iso")
+_post_values = attrgetter(*_POST_FIELDS[:-2], "created_at_iso", "flair")
+
+
+def serialize_organic(results: Iterable[OrganicResult]) -> list[dict[str, Any]]:
+    """Convert organic results to JSON-serializable dicts."""
+    return [dict(zip(_ORGANIC_FIELDS, _organic_values(r))) for r in results]
+
+
+def serialize_paa(items: Iterable[PeopleAlsoAsk]) -> list[dict[str, Any]]:
+    """Convert People Also Ask items to JSON-serializable dicts."""
+    return [dict(zip(_PAA_FIELDS, _paa_values(i))) for i in items]
+
+
+def serialize_videos(videos: Iterable[VideoResult]) -> list[dict[str, Any]]:
+    """Convert video results to JSON-serializable dicts."""
+    return [dict(zip(_VIDEO_FIELDS, _video_values(v))) for v in videos]
+
+
+def serialize_articles(articles: Iterable[Article]) -> list[dict[str, Any]]:
+    """Convert dev.to articles to JSON-serializable dicts."""
+    return [dict(zip(_ARTICLE_FIELDS, _article_values(a))) for a in articles]
+
+
+def serialize_posts(posts: Iterable[RedditPost]) -> list[dict[str, Any]]:
+    """Convert Reddit posts to JSON-serializable dicts."""
+    return [dict(zip(_POST_FIELDS, _post_values(p))) for p in posts]
@@ -1,5 +1,5 @@
 """Serper.dev API client."""
 
-from .client import SerperClient, VideoResult
+from .client import SerperClient, VideoResult, aclose_shared_client
 
-__all__ = ["SerperClient", "VideoResult"]
+__all__ = ["SerperClient", "VideoResult", "aclose_shared_client"]
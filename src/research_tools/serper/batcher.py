@@ -0,0 +1,77 @@
+"""Micro-batching of Serper requests.
+
+Serper endpoints accept a JSON array of queries and answer with an array of
+results in the same order. Requests submitted together are sent as one batch,
+so N concurrent lookups cost one round-trip instead of N.
+
+When the endpoint is idle, a request is sent on the next event loop iteration,
+batched only with requests submitted in the same iteration (e.g. one gather),
+so a lone lookup adds no latency. While a batch is in flight, new requests
+wait up to `max_wait` to be grouped.
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+
+SendFn = Callable[[list[dict]], Awaitable[list[dict]]]
+
+
+class RequestBatcher:
+    """Groups concurrently submitted payloads into one request."""
+
+    def __init__(self, send: SendFn, max_batch: int = 20, max_wait: float = 0.02) -> None:
+        self._send = send
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._in_flight = 0  # batches sent but not yet answered
+        self._dispatches: set[asyncio.Task] = set()  # referenced until done
+
+    async def submit(self, payload: dict) -> dict:
+        """Queue a payload and wait for its slice of the batch response."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((payload, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_task is None:
+            # Idle: only yield one loop iteration; busy: wait out the window
+            delay = self.max_wait if self._in_flight else 0
+            self._flush_task = asyncio.ensure_future(self._flush_later(delay))
+        return await future
+
+    async def _flush_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        self._flush()
+
+    def _flush(self) -> None:
+        """Send everything pending as one batch (in the background)."""
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        self._in_flight += 1
+        try:
+            results = await self._send([payload for payload, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch size mismatch: sent {len(batch)}, got {len(results)}")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._in_flight -= 1
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -1,11 +1,22 @@
 """Serper.dev API client for Google SERP data."""
 
+import asyncio
+import os
 from dataclasses import dataclass, field
 
 import httpx
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
 
-@dataclass
+from .. import fastjson
+from ..ratelimit import TokenBucket
+from .batcher import RequestBatcher
+
+
+@dataclass(slots=True, frozen=True)
 class OrganicResult:
     """Single organic search result."""
 
@@ -15,7 +26,7 @@ class OrganicResult:
     snippet: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PeopleAlsoAsk:
     """People Also Ask item."""
 
@@ -34,7 +45,7 @@ class SearchResult:
     related_searches: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoResult:
     """Single video search result."""
 
@@ -46,7 +57,7 @@ class VideoResult:
     duration: str
     views: str
     date: str
-    thumbnail: str
+    thumbnail: str = ""
 
 
 class SerperError(Exception):
@@ -55,6 +66,54 @@ class SerperError(Exception):
     pass
 
 
+# Outbound limits shared by all Serper calls in the process
+MAX_CONCURRENCY = int(os.getenv("RT_SERPER_MAX_CONCURRENCY", "8"))
+RATE_PER_SECOND = float(os.getenv("RT_SERPER_RATE", "10"))
+# How long requests wait to join a batch while another batch is in flight;
+# an idle endpoint sends at once (0 disables batching)
+BATCH_WAIT_MS = float(os.getenv("RT_SERPER_BATCH_WAIT_MS", "20"))
+BATCH_MAX_SIZE = 20
+# Endpoints documented to accept a JSON array of queries
+BATCH_ENDPOINTS = frozenset({"search"})
+
+# One connection pool shared by every SerperClient in the process, so
+# concurrent calls reuse the same TCP/TLS sessions. Connections, limiters
+# and batchers belong to the event loop that created them, so they are
+# rebuilt together if the loop changes.
+_shared_client: httpx.AsyncClient | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+_concurrency: asyncio.Semaphore | None = None
+_bucket: TokenBucket | None = None
+_batchers: dict[tuple[str, str], RequestBatcher] = {}
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use."""
+    global _shared_client, _shared_loop, _concurrency, _bucket, _batchers
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            # Multiplex concurrent calls over one connection when h2 is installed
+            http2=h2 is not None,
+        )
+        _shared_loop = loop
+        _concurrency = asyncio.Semaphore(MAX_CONCURRENCY)
+        _bucket = TokenBucket(rate=RATE_PER_SECOND, burst=MAX_CONCURRENCY)
+        _batchers = {}
+    return _shared_client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared connection pool (call before the event loop ends)."""
+    global _shared_client, _shared_loop
+    if _shared_client is not None:
+        client, _shared_client, _shared_loop = _shared_client, None, None
+        await client.aclose()
+
+
 class SerperClient:
     """Client for Serper.dev Google SERP API."""
 
@@ -62,17 +121,58 @@ class SerperClient:
 
     def __init__(self, api_key: str) -> None:
         self.api_key = api_key
-        self._client = httpx.AsyncClient(
-            headers={
-                "X-API-KEY": api_key,
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
+        self._headers = {"X-API-KEY": api_key}
+
+    async def _post(self, endpoint: str, payload: dict | list[dict]) -> httpx.Response:
+        """POST to an API endpoint within the shared concurrency/rate limits."""
+        client = _get_shared_client()
+        async with _concurrency:
+            await _bucket.acquire()
+            response = await client.post(
+                f"{self.BASE_URL}/{endpoint}",
+                headers=self._headers,
+                json=payload,
+            )
+
+        if response.status_code == 401:
+            raise SerperError("Invalid API key")
+        if response.status_code == 429:
+            raise SerperError("Rate limit exceeded")
+        if response.status_code != 200:
+            raise SerperError(f"API error: {response.status_code}")
+        return response
+
+    async def _post_batch(self, endpoint: str, payloads: list[dict]) -> list[dict]:
+        """POST several queries as one batch; results come back in order."""
+        if len(payloads) == 1:
+            response = await self._post(endpoint, payloads[0])
+            return [fastjson.loads(response.content)]
+        response = await self._post(endpoint, payloads)
+        return fastjson.loads(response.content)
+
+    async def _request(self, endpoint: str, payload: dict) -> dict:
+        """Send a query, batched with concurrent queries where the endpoint allows."""
+        if BATCH_WAIT_MS <= 0 or endpoint not in BATCH_ENDPOINTS:
+            response = await self._post(endpoint, payload)
+            return fastjson.loads(response.content)
+
+        _get_shared_client()  # binds the batchers to the running loop
+        key = (self.api_key, endpoint)
+        batcher = _batchers.get(key)
+        if batcher is None:
+            batcher = _batchers[key] = RequestBatcher(
+                lambda payloads: self._post_batch(endpoint, payloads),
+                max_batch=BATCH_MAX_SIZE,
+                max_wait=BATCH_WAIT_MS / 1000,
+            )
+        return await batcher.submit(payload)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Release the client.
+
+        The underlying connection pool is shared and stays open for other
+        clients; use aclose_shared_client() to shut it down.
+        """
 
     async def __aenter__(self) -> "SerperClient":
         return self
@@ -99,9 +199,9 @@ class SerperClient:
         Returns:
             SearchResult with organic results, PAA, and related searches
         """
-        response = await self._client.post(
-            f"{self.BASE_URL}/search",
-            json={
+        data = await self._request(
+            "search",
+            {
                 "q": query,
                 "num": num,
                 "gl": gl,
@@ -109,15 +209,6 @@ class SerperClient:
             },
         )
 
-        if response.status_code == 401:
-            raise SerperError("Invalid API key")
-        if response.status_code == 429:
-            raise SerperError("Rate limit exceeded")
-        if response.status_code != 200:
-            raise SerperError(f"API error: {response.status_code}")
-
-        data = response.json()
-
         organic = [
             OrganicResult(
                 position=item.get("position", i + 1),
@@ -138,9 +229,9 @@ class SerperClient:
         ]
 
         related = [
-            item.get("query", "")
+            q
             for item in data.get("relatedSearches", [])
-            if item.get("query")
+            if (q := item.get("query"))
         ]
 
         return SearchResult(
@@ -160,19 +251,7 @@ class SerperClient:
         Returns:
             List of search suggestions
         """
-        response = await self._client.post(
-            f"{self.BASE_URL}/autocomplete",
-            json={"q": query},
-        )
-
-        if response.status_code == 401:
-            raise SerperError("Invalid API key")
-        if response.status_code == 429:
-            raise SerperError("Rate limit exceeded")
-        if response.status_code != 200:
-            raise SerperError(f"API error: {response.status_code}")
-
-        data = response.json()
+        data = await self._request("autocomplete", {"q": query})
         suggestions = data.get("suggestions", [])
         # Handle both string and dict formats
         return [
@@ -199,9 +278,9 @@ class SerperClient:
         Returns:
             List of VideoResult items
         """
-        response = await self._client.post(
-            f"{self.BASE_URL}/videos",
-            json={
+        data = await self._request(
+            "videos",
+            {
                 "q": query,
                 "num": num,
                 "gl": gl,
@@ -209,15 +288,6 @@ class SerperClient:
             },
         )
 
-        if response.status_code == 401:
-            raise SerperError("Invalid API key")
-        if response.status_code == 429:
-            raise SerperError("Rate limit exceeded")
-        if response.status_code != 200:
-            raise SerperError(f"API error: {response.status_code}")
-
-        data = response.json()
-
         return [
             VideoResult(
                 position=i + 1,
@@ -2,6 +2,7 @@
 
 from .base import ResearchSource, Article, TagStats, AuthorStats
 from .devto import DevToResearch
+from .stats import aggregate_tags, aggregate_authors
 from .serper import SerperResearch, KeywordSuggestions, SerpAnalysis
 from .reddit import RedditResearch, RedditPost
 from .youtube import YouTubeResearch, YouTubeSearchResult
@@ -12,6 +13,8 @@ __all__ = [
     "TagStats",
     "AuthorStats",
     "DevToResearch",
+    "aggregate_tags",
+    "aggregate_authors",
     "SerperResearch",
     "KeywordSuggestions",
     "SerpAnalysis",
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Article:
     """Represents a fetched article."""
 
@@ -18,9 +18,22 @@ class Article:
     reading_time: int
     tags: list[str]
     published_at: datetime
+    published_at_iso: str = ""  # published_at formatted once at parse time
+    display_tags: str = ""  # first three tags for table output, set at parse time
 
+    # Frozen for immutability only: the tags list makes instances unhashable
+    __hash__ = None
 
-@dataclass
+    def __post_init__(self) -> None:
+        # The parser precomputes these; derive them for articles built elsewhere
+        if not self.published_at_iso:
+            object.__setattr__(self, "published_at_iso", self.published_at.isoformat())
+        if not self.display_tags and self.tags:
+            display = ", ".join(self.tags[:3]) + ("..." if len(self.tags) > 3 else "")
+            object.__setattr__(self, "display_tags", display)
+
+
+@dataclass(slots=True, frozen=True)
 class TagStats:
     """Aggregated statistics for a tag."""
 
@@ -33,7 +46,8 @@ class TagStats:
     avg_reading_time: float
 
 
-@dataclass
+# Not frozen: aggregate_authors() fills .articles after construction
+@dataclass(slots=True)
 class AuthorStats:
     """Aggregated statistics for an author."""
 
@@ -1,21 +1,119 @@
 """dev.to research source implementation."""
 
 import asyncio
-from datetime import datetime
+import functools
+import logging
+import math
+from operator import attrgetter
+from datetime import datetime, timezone
+from typing import AsyncGenerator
 
 import httpx
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+from .. import fastjson
+from ..ratelimit import TokenBucket, get_with_retry
 from .base import ResearchSource, Article
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (memoized; timestamps repeat across pages/tags).
+
+    Python 3.11+ fromisoformat() accepts the "Z" suffix directly.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _parse_article(
+    data: dict,
+    _parse_iso=_parse_iso,
+    _now=datetime.now,
+    _utc=timezone.utc,
+    _article_cls=Article,
+) -> Article:
+    """Parse one API item into an Article.
+
+    Module-level with globals bound as defaults: this runs once per item.
+    """
+    get = data.get
+    published = get("published_at") or get("published_timestamp")
+    if isinstance(published, str):
+        published_dt = _parse_iso(published)
+    else:
+        published_dt = _now(_utc)
+
+    # tag_list is normally a list; some endpoints send a comma-separated string
+    tags = get("tag_list") or []
+    if type(tags) is str:
+        tags = [tag for tag in map(str.strip, tags.split(",")) if tag]
+
+    user = get("user")
+    return _article_cls(
+        id=get("id", 0),
+        title=get("title", ""),
+        url=get("url", ""),
+        author=user.get("username", "unknown") if user else "unknown",
+        reactions=get("public_reactions_count", 0),
+        comments=get("comments_count", 0),
+        reading_time=get("reading_time_minutes", 0),
+        tags=tags,
+        published_at=published_dt,
+        published_at_iso=published_dt.isoformat(),
+        display_tags=", ".join(tags[:3]) + ("..." if len(tags) > 3 else ""),
+    )
+
 
 class DevToResearch(ResearchSource):
     """dev.to API client for research data."""
 
     API_BASE = "https://dev.to/api"
     MAX_PER_PAGE = 100
+    MAX_CONCURRENCY = 8  # concurrent tag fetches
+    MAX_PAGE_CONCURRENCY = 4  # concurrent page fetches per tag
+    HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    RATE_PER_SECOND = 10  # tightened further by X-RateLimit-* response headers
 
     def __init__(self, api_key: str = ""):
         self.api_key = api_key
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._bucket = TokenBucket(self.RATE_PER_SECOND, self.MAX_CONCURRENCY)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use.
+
+        The client and rate limiter are bound to the running event loop, so
+        both are rebuilt when a later call runs on a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._loop = loop
+            self._bucket = TokenBucket(self.RATE_PER_SECOND, self.MAX_CONCURRENCY)
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=self.HTTP_LIMITS,
+                http2=h2 is not None,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (recreated on next use)."""
+        if self._client is not None:
+            client, self._client, self._loop = self._client, None, None
+            await client.aclose()
+
+    async def __aenter__(self) -> "DevToResearch":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
 
     @property
     def name(self) -> str:
@@ -23,29 +121,7 @@ class DevToResearch(ResearchSource):
 
     def _parse_article(self, data: dict) -> Article:
         """Parse API response into Article object."""
-        published = data.get("published_at") or data.get("published_timestamp")
-        if isinstance(published, str):
-            # Handle ISO format with Z suffix
-            published = published.replace("Z", "+00:00")
-            published_dt = datetime.fromisoformat(published)
-        else:
-            published_dt = datetime.now()
-
-        tags = data.get("tag_list", [])
-        if isinstance(tags, str):
-            tags = [t.strip() for t in tags.split(",") if t.strip()]
-
-        return Article(
-            id=data.get("id", 0),
-            title=data.get("title", ""),
-            url=data.get("url", ""),
-            author=data.get("user", {}).get("username", "unknown"),
-            reactions=data.get("public_reactions_count", 0),
-            comments=data.get("comments_count", 0),
-            reading_time=data.get("reading_time_minutes", 0),
-            tags=tags,
-            published_at=published_dt,
-        )
+        return _parse_article(data)
 
     async def _fetch_page(
         self,
@@ -68,13 +144,14 @@ class DevToResearch(ResearchSource):
         if self.api_key:
             headers["api-key"] = self.api_key
 
-        response = await client.get(
+        response = await get_with_retry(
+            client,
+            self._bucket,
             f"{self.API_BASE}/articles",
             params=params,
             headers=headers,
         )
-        response.raise_for_status()
-        return response.json()
+        return fastjson.loads(response.content)
 
     async def fetch_articles(
         self,
@@ -91,30 +168,105 @@ class DevToResearch(ResearchSource):
         seen_ids: set[int] = set()
         articles: list[Article] = []
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if tags:
-                # Fetch for each tag
-                for tag in tags:
-                    tag_articles = await self._fetch_for_tag(
-                        client, tag, period, limit
-                    )
-                    for article in tag_articles:
-                        if article.id not in seen_ids:
-                            seen_ids.add(article.id)
-                            articles.append(article)
-                            if len(articles) >= limit:
-                                break
-                    if len(articles) >= limit:
+        client = self._get_client()
+        if tags:
+            # Fetch all tags concurrently (bounded), then merge in tag order
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+            async def fetch(tag: str) -> list[Article]:
+                async with semaphore:
+                    return await self._fetch_for_tag(client, tag, period, limit)
+
+            results = await asyncio.gather(*(fetch(tag) for tag in tags), return_exceptions=True)
+            # Only HTTP failures are tolerated per tag; anything else is a bug
+            for result in results:
+                if isinstance(result, BaseException) and not isinstance(result, httpx.HTTPError):
+                    raise result
+            failed = [(tag, r) for tag, r in zip(tags, results) if isinstance(r, BaseException)]
+            if len(failed) == len(results):
+                raise failed[0][1]
+            for tag, error in failed:
+                logger.warning("dev.to fetch failed for tag %r, skipping it: %s", tag, error)
+
+            for tag_articles in results:
+                if isinstance(tag_articles, BaseException):
+                    continue
+                # Batch dedup: drop ids already seen, keep first-seen order
+                by_id = {a.id: a for a in tag_articles}
+                for article_id in seen_ids.intersection(by_id):
+                    del by_id[article_id]
+                seen_ids.update(by_id)
+                articles.extend(by_id.values())
+                if len(articles) >= limit:
+                    break
+        else:
+            # Fetch general trending
+            articles = await self._fetch_for_tag(client, None, period, limit)
+
+        # Keep the first `limit` in merge (tag) order, then most popular first
+        articles = articles[:limit]
+        articles.sort(key=attrgetter("reactions"), reverse=True)
+        return articles
+
+    async def iter_articles(
+        self,
+        tags: list[str] | None = None,
+        period: int = 7,
+        limit: int = 100,
+        per_page: int | None = None,
+    ) -> AsyncGenerator[list[Article], None]:
+        """
+        Yield trending articles page by page, deduplicated across tags.
+
+        Tags are fetched round-robin (page 1 of every tag, then page 2, ...)
+        so each tag is represented early; the pages of a round are fetched
+        concurrently (bounded by MAX_CONCURRENCY). Stops after `limit`
+        articles in total; callers may stop earlier, in which case later
+        rounds are never requested. By default a page is an equal share of
+        `limit` per tag, so one round can cover the whole sample.
+        """
+        seen_ids: set[int] = set()
+        count = 0
+        active: list[str | None] = list(tags) if tags else [None]
+        per_page = min(per_page or math.ceil(limit / len(active)), self.MAX_PER_PAGE)
+        page = 1
+
+        client = self._get_client()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def fetch(tag: str | None, page: int) -> list[dict]:
+            async with semaphore:
+                try:
+                    return await self._fetch_page(client, tag, period, page, per_page)
+                except httpx.HTTPStatusError:
+                    return []
+
+        while active:
+            round_tags = list(active)
+            pages = await asyncio.gather(*(fetch(tag, page) for tag in round_tags))
+
+            # Merge in tag order, as if the round had been fetched sequentially
+            for tag, data in zip(round_tags, pages):
+                if len(data) < per_page:
+                    # No more pages for this tag
+                    active.remove(tag)
+
+                batch: list[Article] = []
+                for item in data:
+                    article = _parse_article(item)
+                    if article.id in seen_ids:
+                        continue
+                    seen_ids.add(article.id)
+                    batch.append(article)
+                    count += 1
+                    if count >= limit:
                         break
-                    # Small delay between tags to be nice to API
-                    await asyncio.sleep(0.1)
-            else:
-                # Fetch general trending
-                articles = await self._fetch_for_tag(client, None, period, limit)
+                if batch:
+                    yield batch
+                if count >= limit:
+                    return
 
-        # Sort by reactions (most popular first)
-        articles.sort(key=lambda a: a.reactions, reverse=True)
-        return articles[:limit]
+            page += 1
 
     async def _fetch_for_tag(
         self,
@@ -123,31 +275,34 @@ class DevToResearch(ResearchSource):
         period: int,
         limit: int,
     ) -> list[Article]:
-        """Fetch articles for a specific tag with pagination."""
-        articles: list[Article] = []
-        page = 1
+        """Fetch articles for a specific tag, requesting the needed pages concurrently."""
+        if limit <= 0:
+            return []
+
         per_page = min(limit, self.MAX_PER_PAGE)
+        pages_needed = math.ceil(limit / per_page)
+        semaphore = asyncio.Semaphore(self.MAX_PAGE_CONCURRENCY)
 
-        while len(articles) < limit:
-            try:
-                data = await self._fetch_page(client, tag, period, page, per_page)
-            except httpx.HTTPStatusError:
-                break
+        async def fetch(page: int) -> list[dict] | None:
+            async with semaphore:
+                try:
+                    return await self._fetch_page(client, tag, period, page, per_page)
+                except httpx.HTTPStatusError:
+                    return None
 
+        pages = await asyncio.gather(*(fetch(page) for page in range(1, pages_needed + 1)))
+
+        articles: list[Article] = []
+        for data in pages:
+            # A failed or empty page ends the results, as with sequential paging
             if not data:
                 break
 
-            for item in data:
-                articles.append(self._parse_article(item))
-                if len(articles) >= limit:
-                    break
+            # Only parse as many items as are still needed for limit
+            articles.extend(map(_parse_article, data[: limit - len(articles)]))
 
-            if len(data) < per_page:
-                # No more pages
+            if len(data) < per_page or len(articles) >= limit:
+                # No more pages, or enough articles
                 break
 
-            page += 1
-            # Small delay between pages
-            await asyncio.sleep(0.1)
-
         return articles
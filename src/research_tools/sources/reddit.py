@@ -3,11 +3,20 @@
 import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
 
 import httpx
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
 
-@dataclass
+from .. import fastjson
+from ..ratelimit import TokenBucket, get_with_retry
+
+
+@dataclass(slots=True, frozen=True)
 class RedditPost:
     """Reddit post data for research."""
 
@@ -22,6 +31,54 @@ class RedditPost:
     comments: int
     created_at: datetime
     flair: str | None = None
+    created_at_iso: str = ""  # created_at formatted once at parse time
+
+    def __post_init__(self) -> None:
+        # The parser precomputes this; derive it for posts built elsewhere
+        # (cached CLI rows carry created_at as an ISO string already)
+        if not self.created_at_iso:
+            created = self.created_at
+            iso = created if isinstance(created, str) else created.isoformat()
+            object.__setattr__(self, "created_at_iso", iso)
+
+
+_UTC = timezone.utc
+_EPOCH = datetime.fromtimestamp(0, tz=_UTC)  # shared for posts without created_utc
+_EPOCH_ISO = _EPOCH.isoformat()
+
+
+def _parse_post(
+    data: dict,
+    _fromtimestamp=datetime.fromtimestamp,
+    _utc=_UTC,
+    _post_cls=RedditPost,
+) -> RedditPost:
+    """Parse one listing child into a RedditPost.
+
+    Module-level with globals bound as defaults: this runs once per post.
+    """
+    get = data.get("data", {}).get
+    timestamp = get("created_utc")
+    if timestamp:
+        created_utc = _fromtimestamp(timestamp, tz=_utc)
+        created_iso = created_utc.isoformat()
+    else:
+        created_utc, created_iso = _EPOCH, _EPOCH_ISO
+
+    return _post_cls(
+        id=get("id", ""),
+        title=get("title", ""),
+        url=get("url", ""),
+        permalink=f"https://reddit.com{get('permalink', '')}",
+        author=get("author", "[deleted]"),
+        subreddit=get("subreddit", ""),
+        score=get("score", 0),
+        upvote_ratio=get("upvote_ratio", 0),
+        comments=get("num_comments", 0),
+        created_at=created_utc,
+        flair=get("link_flair_text"),
+        created_at_iso=created_iso,
+    )
 
 
 class RedditResearch:
@@ -29,6 +86,45 @@ class RedditResearch:
 
     USER_AGENT = "blog-tools/1.0 (research)"
     BASE_URL = "https://www.reddit.com"
+    MAX_CONCURRENCY = 8
+    HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    RATE_PER_SECOND = 10  # tightened further by X-RateLimit-* response headers
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._bucket = TokenBucket(self.RATE_PER_SECOND, self.MAX_CONCURRENCY)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use.
+
+        The client and rate limiter are bound to the running event loop, so
+        both are rebuilt when a later call runs on a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._loop = loop
+            self._bucket = TokenBucket(self.RATE_PER_SECOND, self.MAX_CONCURRENCY)
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=self.HTTP_LIMITS,
+                headers={"User-Agent": self.USER_AGENT},
+                follow_redirects=True,
+                http2=h2 is not None,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (recreated on next use)."""
+        if self._client is not None:
+            client, self._client, self._loop = self._client, None, None
+            await client.aclose()
+
+    async def __aenter__(self) -> "RedditResearch":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
 
     @property
     def name(self) -> str:
@@ -36,24 +132,7 @@ class RedditResearch:
 
     def _parse_post(self, data: dict) -> RedditPost:
         """Parse Reddit API response into RedditPost."""
-        post = data.get("data", {})
-        created_utc = datetime.fromtimestamp(
-            post.get("created_utc", 0), tz=timezone.utc
-        )
-
-        return RedditPost(
-            id=post.get("id", ""),
-            title=post.get("title", ""),
-            url=post.get("url", ""),
-            permalink=f"https://reddit.com{post.get('permalink', '')}",
-            author=post.get("author", "[deleted]"),
-            subreddit=post.get("subreddit", ""),
-            score=post.get("score", 0),
-            upvote_ratio=post.get("upvote_ratio", 0),
-            comments=post.get("num_comments", 0),
-            created_at=created_utc,
-            flair=post.get("link_flair_text"),
-        )
+        return _parse_post(data)
 
     async def _fetch_subreddit(
         self,
@@ -72,17 +151,12 @@ class RedditResearch:
             params["t"] = period
 
         try:
-            response = await client.get(
-                url,
-                params=params,
-                headers={"User-Agent": self.USER_AGENT},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-            data = response.json()
+            response = await get_with_retry(client, self._bucket, url, params=params)
+            data = fastjson.loads(response.content)
 
             children = data.get("data", {}).get("children", [])
-            return [self._parse_post(child) for child in children]
+            parse = _parse_post
+            return [parse(child) for child in children]
 
         except httpx.HTTPStatusError:
             return []
@@ -106,20 +180,26 @@ class RedditResearch:
             limit: Max posts per subreddit
 
         Returns:
-            List of RedditPost objects sorted by score
+            List of RedditPost objects sorted by score, one per URL
         """
-        posts: list[RedditPost] = []
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for subreddit in subreddits:
-                sub_posts = await self._fetch_subreddit(
-                    client, subreddit, sort, period, limit
-                )
-                posts.extend(sub_posts)
-                # Small delay between subreddits
-                if len(subreddits) > 1:
-                    await asyncio.sleep(0.2)
-
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def fetch(client: httpx.AsyncClient, subreddit: str) -> list[RedditPost]:
+            async with semaphore:
+                return await self._fetch_subreddit(client, subreddit, sort, period, limit)
+
+        # Subreddits are fetched concurrently over the pooled client
+        client = self._get_client()
+        results = await asyncio.gather(*(fetch(client, s) for s in subreddits))
+
+        # Cross-posts share a URL across subreddits: keep the highest-scoring copy
+        by_url: dict[str, RedditPost] = {}
+        for sub_posts in results:
+            for post in sub_posts:
+                kept = by_url.get(post.url)
+                if kept is None or post.score > kept.score:
+                    by_url[post.url] = post
+        posts = list(by_url.values())
         # Sort by score (highest first)
-        posts.sort(key=lambda p: p.score, reverse=True)
+        posts.sort(key=attrgetter("score"), reverse=True)
         return posts
@@ -4,17 +4,21 @@ from dataclasses import dataclass, field
 
 from ..serper import SerperClient
 from ..serper.client import SearchResult, OrganicResult, PeopleAlsoAsk
+from .memo import SingleFlight
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KeywordSuggestions:
     """Keyword autocomplete results."""
 
     query: str
     suggestions: list[str] = field(default_factory=list)
 
+    # Frozen for immutability only: list fields make instances unhashable
+    __hash__ = None
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SerpAnalysis:
     """SERP analysis for a query."""
 
@@ -23,6 +27,9 @@ class SerpAnalysis:
     people_also_ask: list[PeopleAlsoAsk] = field(default_factory=list)
     related_searches: list[str] = field(default_factory=list)
 
+    # Frozen for immutability only: list fields make instances unhashable
+    __hash__ = None
+
 
 class SerperResearch:
     """Research source using Serper.dev for Google SERP data."""
@@ -31,6 +38,35 @@ class SerperResearch:
 
     def __init__(self, api_key: str) -> None:
         self.api_key = api_key
+        self._client: SerperClient | None = None
+        # Concurrent get_serp/get_paa/get_related share one search per (query, num, gl)
+        self._searches: SingleFlight[SearchResult] = SingleFlight()
+        self._suggestions: SingleFlight[list[str]] = SingleFlight()
+
+    def _get_client(self) -> SerperClient:
+        """Get the shared Serper client, creating it on first use."""
+        if self._client is None:
+            self._client = SerperClient(self.api_key)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared Serper client (recreated on next use)."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.close()
+
+    async def __aenter__(self) -> "SerperResearch":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def _search(self, query: str, num: int, gl: str) -> SearchResult:
+        """Run a search, joining an identical search already in flight."""
+        client = self._get_client()
+        return await self._searches.do(
+            (query, num, gl), lambda: client.search(query, num=num, gl=gl)
+        )
 
     async def get_keywords(self, query: str) -> KeywordSuggestions:
         """
@@ -42,9 +78,10 @@ class SerperResearch:
         Returns:
             KeywordSuggestions with suggestions list
         """
-        async with SerperClient(self.api_key) as client:
-            suggestions = await client.autocomplete(query)
-            return KeywordSuggestions(query=query, suggestions=suggestions)
+        client = self._get_client()
+        # Concurrent lookups for the same query share one autocomplete call
+        suggestions = await self._suggestions.do(query, lambda: client.autocomplete(query))
+        return KeywordSuggestions(query=query, suggestions=suggestions)
 
     async def get_serp(
         self,
@@ -63,14 +100,13 @@ class SerperResearch:
         Returns:
             SerpAnalysis with organic results, PAA, and related searches
         """
-        async with SerperClient(self.api_key) as client:
-            result = await client.search(query, num=num, gl=gl)
-            return SerpAnalysis(
-                query=query,
-                results=result.organic,
-                people_also_ask=result.people_also_ask,
-                related_searches=result.related_searches,
-            )
+        result = await self._search(query, num, gl)
+        return SerpAnalysis(
+            query=query,
+            results=result.organic,
+            people_also_ask=result.people_also_ask,
+            related_searches=result.related_searches,
+        )
 
     async def get_paa(self, query: str, gl: str = "us") -> list[PeopleAlsoAsk]:
         """
@@ -83,9 +119,8 @@ class SerperResearch:
         Returns:
             List of PAA items
         """
-        async with SerperClient(self.api_key) as client:
-            result = await client.search(query, num=10, gl=gl)
-            return result.people_also_ask
+        result = await self._search(query, 10, gl)
+        return result.people_also_ask
 
     async def get_related(self, query: str, gl: str = "us") -> list[str]:
         """
@@ -98,6 +133,5 @@ class SerperResearch:
         Returns:
             List of related search queries
         """
-        async with SerperClient(self.api_key) as client:
-            result = await client.search(query, num=10, gl=gl)
-            return result.related_searches
+        result = await self._search(query, 10, gl)
+        return result.related_searches
@@ -0,0 +1,109 @@
+"""Engagement aggregation over fetched articles."""
+
+import heapq
+
+from .base import Article, TagStats, AuthorStats
+
+
+def aggregate_tags(
+    articles: list[Article],
+    tags: list[str],
+    limit: int,
+) -> list[TagStats]:
+    """
+    Aggregate engagement per tag in a single pass.
+
+    Args:
+        articles: Articles to aggregate
+        tags: Tags to report on (others are ignored)
+        limit: Max tags to return
+
+    Returns:
+        TagStats sorted by average reactions (highest first)
+    """
+    tag_set = frozenset(tags)  # O(1) membership per article tag
+    # tag -> [count, reactions, comments, reading_time]
+    totals: dict[str, list[int]] = {}
+    for article in articles:
+        # Cheap C-level rejection of articles without any requested tag
+        if tag_set.isdisjoint(article.tags):
+            continue
+        for tag in article.tags:
+            if tag in tag_set:
+                acc = totals.get(tag)
+                if acc is None:
+                    acc = totals[tag] = [0, 0, 0, 0]
+                acc[0] += 1
+                acc[1] += article.reactions
+                acc[2] += article.comments
+                acc[3] += article.reading_time
+
+    # Top-K selection over the raw totals (in `tags` order, so ties keep the
+    # order of a stable descending sort); only the winners become TagStats
+    top = heapq.nlargest(
+        limit,
+        ((tag_name, totals[tag_name]) for tag_name in tags if tag_name in totals),
+        key=lambda item: item[1][1] / item[1][0],
+    )
+
+    return [
+        TagStats(
+            name=tag_name,
+            article_count=count,
+            total_reactions=total_reactions,
+            total_comments=total_comments,
+            avg_reactions=total_reactions / count,
+            avg_comments=total_comments / count,
+            avg_reading_time=total_reading / count,
+        )
+        for tag_name, (count, total_reactions, total_comments, total_reading) in top
+    ]
+
+
+def aggregate_authors(
+    articles: list[Article],
+    limit: int,
+) -> list[AuthorStats]:
+    """
+    Aggregate engagement per author in a single pass.
+
+    Args:
+        articles: Articles to aggregate
+        limit: Max authors to return
+
+    Returns:
+        AuthorStats sorted by total reactions (highest first)
+    """
+    # author -> [count, reactions, comments]
+    totals: dict[str, list[int]] = {}
+    for article in articles:
+        acc = totals.get(article.author)
+        if acc is None:
+            acc = totals[article.author] = [0, 0, 0]
+        acc[0] += 1
+        acc[1] += article.reactions
+        acc[2] += article.comments
+
+    # Top-K selection over the raw totals; same order as a stable descending
+    # sort, and only the winners become AuthorStats
+    top = [
+        AuthorStats(
+            username=username,
+            article_count=count,
+            total_reactions=total_reactions,
+            total_comments=total_comments,
+            avg_reactions=total_reactions / count,
+        )
+        for username, (count, total_reactions, total_comments) in heapq.nlargest(
+            limit, totals.items(), key=lambda item: item[1][1]
+        )
+    ]
+
+    # Article lists are only collected for the authors that made the cut
+    by_author = {a.username: a.articles for a in top}
+    for article in articles:
+        author_articles = by_author.get(article.author)
+        if author_articles is not None:
+            author_articles.append(article)
+
+    return top
@@ -4,15 +4,19 @@ from dataclasses import dataclass, field
 
 from ..serper import SerperClient
 from ..serper.client import VideoResult
+from .memo import SingleFlight
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class YouTubeSearchResult:
     """YouTube video search results."""
 
     query: str
     videos: list[VideoResult] = field(default_factory=list)
 
+    # Frozen for immutability only: list fields make instances unhashable
+    __hash__ = None
+
 
 class YouTubeResearch:
     """Research source for YouTube videos via Serper Videos API."""
@@ -21,6 +25,33 @@ class YouTubeResearch:
 
     def __init__(self, api_key: str) -> None:
         self.api_key = api_key
+        self._client: SerperClient | None = None
+        self._video_searches: SingleFlight[list[VideoResult]] = SingleFlight()
+
+    def _get_client(self) -> SerperClient:
+        """Get the shared Serper client, creating it on first use."""
+        if self._client is None:
+            self._client = SerperClient(self.api_key)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared Serper client (recreated on next use)."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.close()
+
+    async def __aenter__(self) -> "YouTubeResearch":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def _videos(self, query: str, num: int, gl: str) -> list[VideoResult]:
+        """Run a video search, joining an identical search already in flight."""
+        client = self._get_client()
+        return await self._video_searches.do(
+            (query, num, gl), lambda: client.videos(query, num=num, gl=gl)
+        )
 
     async def search(
         self,
@@ -39,9 +70,8 @@ class YouTubeResearch:
         Returns:
             YouTubeSearchResult with video list
         """
-        async with SerperClient(self.api_key) as client:
-            videos = await client.videos(query, num=limit, gl=region)
-            return YouTubeSearchResult(query=query, videos=videos)
+        videos = await self._videos(query, limit, region)
+        return YouTubeSearchResult(query=query, videos=videos)
 
     async def channel_videos(
         self,
@@ -58,14 +88,19 @@ class YouTubeResearch:
             region: Country code
 
         Returns:
-            YouTubeSearchResult with videos from channel
+            YouTubeSearchResult with videos from channel (all search
+            results if none match the channel name)
         """
         query = f'"{channel}" site:youtube.com'
-        async with SerperClient(self.api_key) as client:
-            videos = await client.videos(query, num=limit, gl=region)
-            # Filter to only include videos from matching channel
-            filtered = [v for v in videos if channel.lower() in v.channel.lower()]
-            return YouTubeSearchResult(query=channel, videos=filtered or videos)
+        videos = await self._videos(query, limit, region)
+        # Filter to only include videos from matching channel
+        needle = channel.lower()
+        filtered = [v for v in videos if needle in v.channel.lower()]
+        if not filtered:
+            # No channel name matched (the name may differ from the one
+            # YouTube displays), so return the unfiltered search results
+            return YouTubeSearchResult(query=channel, videos=videos)
+        return YouTubeSearchResult(query=channel, videos=filtered)
 
     async def trending(
         self,
@@ -89,6 +124,5 @@ class YouTubeResearch:
         else:
             query = f"trending videos {region}"
 
-        async with SerperClient(self.api_key) as client:
-            videos = await client.videos(query, num=limit, gl=region)
-            return YouTubeSearchResult(query=query, videos=videos)
+        videos = await self._videos(query, limit, region)
+        return YouTubeSearchResult(query=query, videos=videos)
@@ -0,0 +1,95 @@
+"""Tests for the Serper request batcher."""
+
+import asyncio
+
+import pytest
+
+from research_tools.serper.batcher import RequestBatcher
+
+
+def test_results_match_submission_order():
+    sent: list[list[dict]] = []
+
+    async def send(payloads):
+        sent.append(payloads)
+        await asyncio.sleep(0)
+        return [{"echo": p["q"]} for p in payloads]
+
+    async def run():
+        batcher = RequestBatcher(send, max_batch=10, max_wait=0.01)
+        return await asyncio.gather(*(batcher.submit({"q": i}) for i in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == [{"echo": i} for i in range(5)]
+    assert sent == [[{"q": i} for i in range(5)]]
+
+
+def test_max_batch_splits_requests():
+    sent: list[list[dict]] = []
+
+    async def send(payloads):
+        sent.append(payloads)
+        return [{"echo": p["q"]} for p in payloads]
+
+    async def run():
+        batcher = RequestBatcher(send, max_batch=2, max_wait=0.01)
+        return await asyncio.gather(*(batcher.submit({"q": i}) for i in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == [{"echo": i} for i in range(5)]
+    assert [len(batch) for batch in sent] == [2, 2, 1]
+
+
+def test_send_error_reaches_every_caller():
+    async def send(payloads):
+        raise RuntimeError("upstream down")
+
+    async def run():
+        batcher = RequestBatcher(send)
+        return await asyncio.gather(
+            *(batcher.submit({"q": i}) for i in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert len(results) == 3
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_size_mismatch_is_an_error():
+    async def send(payloads):
+        return [{}]
+
+    async def run():
+        batcher = RequestBatcher(send)
+        return await asyncio.gather(
+            batcher.submit({"q": 1}),
+            batcher.submit({"q": 2}),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_cancelled_send_cancels_waiters():
+    async def run():
+        entered = asyncio.Event()
+
+        async def send(payloads):
+            entered.set()
+            await asyncio.sleep(10)
+
+        batcher = RequestBatcher(send)
+        waiter = asyncio.ensure_future(batcher.submit({"q": 1}))
+        await entered.wait()
+        for task in batcher._dispatches:
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(run())
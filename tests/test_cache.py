@@ -0,0 +1,151 @@
+"""Tests for the cached() MCP tool decorator."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from research_tools import cache
+from research_tools.serper.client import SerperError
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Replace the SQLite layer with a dict of key -> (data, created, expires)."""
+    rows: dict = {}
+
+    def peek(key):
+        return rows.get(key)
+
+    def set_(key, data, ttl_hours):
+        now = datetime.utcnow()
+        rows[key] = (data, now, now + timedelta(hours=ttl_hours))
+
+    monkeypatch.setattr(cache, "_db_peek", peek)
+    monkeypatch.setattr(cache, "_db_set", set_)
+    cache._MEM_CACHE.clear()
+    yield rows
+    cache._MEM_CACHE.clear()
+
+
+def _tool(calls: list, result=None, error: Exception | None = None):
+    @cache.cached(
+        "long",
+        key_fn=lambda query, no_cache: ("test", cache.canonical(query)),
+        hit_overlay=lambda query, no_cache: {"query": query},
+    )
+    async def tool(query: str, no_cache: bool = False) -> dict:
+        calls.append(query)
+        if error is not None:
+            raise error
+        return result if result is not None else {"query": query, "value": len(calls)}
+
+    return tool
+
+
+def test_miss_then_hit(db):
+    calls: list = []
+    tool = _tool(calls)
+
+    first = asyncio.run(tool("python tips"))
+    second = asyncio.run(tool("python tips"))
+
+    assert first == {"query": "python tips", "value": 1}
+    assert second == {"query": "python tips", "value": 1, "cached": True}
+    assert calls == ["python tips"]
+    assert "test:python tips" in db
+
+
+def test_hit_echoes_request_arguments(db):
+    calls: list = []
+    tool = _tool(calls)
+
+    asyncio.run(tool("Python  Tips"))
+    hit = asyncio.run(tool("python tips"))
+
+    # Same normalized key, but the hit reports this call's query
+    assert hit["query"] == "python tips"
+    assert hit["cached"] is True
+    assert len(calls) == 1
+
+
+def test_hit_from_sqlite_after_memory_is_cleared(db):
+    calls: list = []
+    tool = _tool(calls)
+
+    asyncio.run(tool("q"))
+    cache._MEM_CACHE.clear()
+    hit = asyncio.run(tool("q"))
+
+    assert hit["cached"] is True
+    assert len(calls) == 1
+
+
+def test_no_cache_skips_lookup_but_stores(db):
+    calls: list = []
+    tool = _tool(calls)
+
+    asyncio.run(tool("q"))
+    fresh = asyncio.run(tool("q", no_cache=True))
+
+    assert "cached" not in fresh
+    assert fresh["value"] == 2
+    assert db["test:q"][0]["value"] == 2
+
+
+def test_error_results_are_not_cached(db):
+    calls: list = []
+    tool = _tool(calls, result={"error": "boom"})
+
+    asyncio.run(tool("q"))
+    asyncio.run(tool("q"))
+
+    assert len(calls) == 2
+    assert db == {}
+
+
+def test_expired_entry_is_refetched(db):
+    past = datetime.utcnow() - timedelta(hours=1)
+    db["test:q"] = ({"query": "q", "value": 0}, past - timedelta(hours=48), past)
+    calls: list = []
+    tool = _tool(calls)
+
+    result = asyncio.run(tool("q"))
+
+    assert result == {"query": "q", "value": 1}
+    assert calls == ["q"]
+
+
+def test_upstream_error_falls_back_to_stale_entry(db):
+    past = datetime.utcnow() - timedelta(hours=1)
+    db["test:q"] = ({"query": "old", "value": 0}, past - timedelta(hours=48), past)
+    tool = _tool([], error=SerperError("Rate limit exceeded"))
+
+    result = asyncio.run(tool("q"))
+
+    assert result == {"query": "q", "value": 0, "cached": True, "stale": True}
+
+
+def test_upstream_error_without_entry_raises(db):
+    tool = _tool([], error=SerperError("Rate limit exceeded"))
+
+    with pytest.raises(SerperError):
+        asyncio.run(tool("q"))
+
+
+def test_concurrent_misses_are_coalesced(db):
+    calls: list = []
+
+    @cache.cached("long", key_fn=lambda query: ("test", query))
+    async def tool(query: str) -> dict:
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return {"query": query}
+
+    async def run():
+        return await asyncio.gather(*(tool("q") for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert calls == ["q"]
+    assert results == [{"query": "q"}] * 5
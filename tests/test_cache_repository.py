@@ -0,0 +1,87 @@
+"""Tests for CacheRepository payload storage."""
+
+import zlib
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from research_tools import fastjson
+from research_tools.db import CacheRepository
+from research_tools.db.models import CacheEntry  # noqa: F401 - registers the table
+
+DATA = {"query": "python", "results": [{"position": 1, "title": "Python", "link": "https://python.org"}]}
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _insert_raw(session: Session, key: str, data: bytes | str) -> None:
+    now = datetime.utcnow()
+    session.execute(
+        text(
+            "INSERT INTO cache_entries (key, data, created_at, expires_at) "
+            "VALUES (:key, :data, :created_at, :expires_at)"
+        ),
+        {"key": key, "data": data, "created_at": now, "expires_at": now + timedelta(hours=1)},
+    )
+    session.commit()
+
+
+def test_round_trip(session):
+    repo = CacheRepository(session)
+    repo.set("k", DATA)
+
+    assert repo.get("k") == DATA
+    assert repo.peek("k")[0] == DATA
+
+
+def test_new_rows_are_compressed_with_preset_dictionary(session):
+    repo = CacheRepository(session)
+    entry = repo.set("k", DATA)
+
+    assert isinstance(entry.data, bytes)
+    assert entry.data[:1] == b"\x02"
+
+
+def test_legacy_text_row(session):
+    _insert_raw(session, "k", fastjson.dumps(DATA).decode())
+    repo = CacheRepository(session)
+
+    assert repo.get("k") == DATA
+    assert repo.get_many(["k"]) == {"k": DATA}
+
+
+def test_plain_zlib_row(session):
+    _insert_raw(session, "k", b"\x01" + zlib.compress(fastjson.dumps(DATA)))
+    repo = CacheRepository(session)
+
+    assert repo.get("k") == DATA
+    assert repo.peek("k")[0] == DATA
+
+
+def test_unknown_format_is_rejected(session):
+    _insert_raw(session, "k", b"\x7fgarbage")
+    repo = CacheRepository(session)
+
+    with pytest.raises(ValueError):
+        repo.get("k")
+
+
+def test_set_many_and_get_many(session):
+    repo = CacheRepository(session)
+    repo.set("a", {"v": 0})
+
+    assert repo.set_many({"a": {"v": 1}, "b": {"v": 2}}) == 2
+    assert repo.get_many(["a", "b", "missing"]) == {"a": {"v": 1}, "b": {"v": 2}}
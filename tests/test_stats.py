@@ -0,0 +1,114 @@
+"""Tests for dev.to engagement aggregation."""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from research_tools.sources.base import Article, AuthorStats, TagStats
+from research_tools.sources.stats import aggregate_authors, aggregate_tags
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _article(id: int, author: str, reactions: int, comments: int, tags: list[str]) -> Article:
+    return Article(
+        id=id,
+        title=f"Article {id}",
+        url=f"https://dev.to/{author}/{id}",
+        author=author,
+        reactions=reactions,
+        comments=comments,
+        reading_time=id % 7 + 1,
+        tags=tags,
+        published_at=NOW,
+    )
+
+
+# Includes ties on avg_reactions / total_reactions to check ordering
+ARTICLES = [
+    _article(1, "ana", 10, 1, ["python", "webdev"]),
+    _article(2, "bob", 30, 4, ["javascript"]),
+    _article(3, "ana", 20, 2, ["python", "ai"]),
+    _article(4, "cid", 30, 0, ["webdev", "javascript", "css"]),
+    _article(5, "dan", 5, 5, ["rust"]),
+    _article(6, "eve", 15, 3, ["ai", "python"]),
+    _article(7, "bob", 0, 1, ["css"]),
+    _article(8, "fay", 30, 2, ["go"]),
+]
+TAGS = ["python", "javascript", "webdev", "ai", "css", "rust", "go", "unused"]
+
+
+def _baseline_tags(articles: list[Article], tags: list[str], limit: int) -> list[TagStats]:
+    """The original per-tag aggregation from the dev.to CLI."""
+    tag_data: dict[str, list[Article]] = defaultdict(list)
+    for article in articles:
+        for tag in article.tags:
+            if tag in tags:
+                tag_data[tag].append(article)
+
+    stats = []
+    for name in tags:
+        tag_articles = tag_data.get(name, [])
+        if not tag_articles:
+            continue
+        count = len(tag_articles)
+        total_reactions = sum(a.reactions for a in tag_articles)
+        total_comments = sum(a.comments for a in tag_articles)
+        total_reading = sum(a.reading_time for a in tag_articles)
+        stats.append(TagStats(
+            name=name,
+            article_count=count,
+            total_reactions=total_reactions,
+            total_comments=total_comments,
+            avg_reactions=total_reactions / count,
+            avg_comments=total_comments / count,
+            avg_reading_time=total_reading / count,
+        ))
+    stats.sort(key=lambda t: t.avg_reactions, reverse=True)
+    return stats[:limit]
+
+
+def _baseline_authors(articles: list[Article], limit: int) -> list[AuthorStats]:
+    """The original per-author aggregation from the dev.to CLI."""
+    author_data: dict[str, list[Article]] = defaultdict(list)
+    for article in articles:
+        author_data[article.author].append(article)
+
+    stats = []
+    for username, user_articles in author_data.items():
+        count = len(user_articles)
+        total_reactions = sum(a.reactions for a in user_articles)
+        stats.append(AuthorStats(
+            username=username,
+            article_count=count,
+            total_reactions=total_reactions,
+            total_comments=sum(a.comments for a in user_articles),
+            avg_reactions=total_reactions / count,
+            articles=user_articles,
+        ))
+    stats.sort(key=lambda a: a.total_reactions, reverse=True)
+    return stats[:limit]
+
+
+def test_aggregate_tags_matches_baseline():
+    for limit in (1, 3, 5, len(TAGS)):
+        assert aggregate_tags(ARTICLES, TAGS, limit) == _baseline_tags(ARTICLES, TAGS, limit)
+
+
+def test_aggregate_tags_follows_requested_tag_order_on_ties():
+    reordered = list(reversed(TAGS))
+    assert aggregate_tags(ARTICLES, reordered, 10) == _baseline_tags(ARTICLES, reordered, 10)
+
+
+def test_aggregate_tags_empty():
+    assert aggregate_tags([], TAGS, 10) == []
+
+
+def test_aggregate_authors_matches_baseline():
+    for limit in (1, 2, 4, 10):
+        assert aggregate_authors(ARTICLES, limit) == _baseline_authors(ARTICLES, limit)
+
+
+def test_aggregate_authors_collects_articles_in_order():
+    (top,) = aggregate_authors(ARTICLES[:4], 1)
+    assert top.username == "ana"
+    assert [a.id for a in top.articles] == [1, 3]